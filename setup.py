@@ -61,6 +61,8 @@ setup(
             # Test / Dev tools
             "pytest",
             "pytest-cov",
+            "pytest-xdist",
+            "pyfakefs",
             "mypy",
             "black",
             "isort",
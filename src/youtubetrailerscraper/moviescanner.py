@@ -24,8 +24,10 @@ Example:
 from __future__ import annotations
 
 import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List
+from typing import Iterator, List
 
 from pydevmate import CacheIt
 
@@ -34,6 +36,12 @@ logger = logging.getLogger(__name__)
 # Video file extensions to recognize
 VIDEO_EXTENSIONS = {".mp4", ".mkv", ".avi", ".m4v", ".mov"}
 
+# Case-insensitive substring that marks a file as a trailer
+TRAILER_KEYWORD = "trailer"
+
+# Upper bound on base paths scanned concurrently by find_missing_trailers
+MAX_SCAN_WORKERS = 8
+
 
 class MovieScanner:
     """Scan movie directories to detect missing trailer files.
@@ -74,9 +82,13 @@ class MovieScanner:
             True if directory contains at least one video file, False otherwise.
         """
         try:
-            return any(
-                f.suffix.lower() in VIDEO_EXTENSIONS for f in directory.iterdir() if f.is_file()
-            )
+            with os.scandir(directory) as entries:
+                # Extension test first: DirEntry.is_file() may cost a stat() call
+                return any(
+                    os.path.splitext(entry.name)[1].lower() in VIDEO_EXTENSIONS
+                    and entry.is_file()
+                    for entry in entries
+                )
         except (PermissionError, OSError) as e:
             logger.warning("Error checking video files in %s: %s", directory, e)
             return False
@@ -95,19 +107,19 @@ class MovieScanner:
             True if at least one trailer file is found, False otherwise.
         """
         try:
-            for file_path in movie_dir.iterdir():
-                if file_path.is_file() and "trailer" in file_path.name.lower():
-                    logger.debug("Trailer found in: %s (%s)", movie_dir, file_path.name)
-                    return True
+            with os.scandir(movie_dir) as entries:
+                for entry in entries:
+                    # Name check first, then the d_type-backed is_file()
+                    if TRAILER_KEYWORD in entry.name.lower() and entry.is_file():
+                        logger.debug("Trailer found in: %s (%s)", movie_dir, entry.name)
+                        return True
             return False
         except (PermissionError, OSError) as e:
             logger.warning("Error checking for trailer in %s: %s", movie_dir, e)
             return False
 
     @CacheIt(max_duration=86400, backend="diskcache")  # 24 hour cache
-    def find_missing_trailers(  # pylint: disable=too-many-branches
-        self, paths: List[Path], sample_size: int = 0
-    ) -> List[Path]:
+    def find_missing_trailers(self, paths: List[Path], sample_size: int = 0) -> List[Path]:
         """Find movie directories that are missing trailer files.
 
         Scans the provided paths for movie directories and identifies which ones
@@ -119,6 +131,9 @@ class MovieScanner:
             The complete results list is cached - directory scanning AND
             trailer detection. Cache key includes sample_size to ensure different
             sample sizes use separate cache entries.
+            Without a sample size, base paths are scanned concurrently (one
+            thread each, up to MAX_SCAN_WORKERS): the scan is bound by directory
+            I/O, which releases the GIL. Results keep the order of paths.
 
         Args:
             paths: List of directory paths to scan for movies with missing trailers.
@@ -133,6 +148,9 @@ class MovieScanner:
         Raises:
             ValueError: If paths is empty or None.
 
+        See Also:
+            iter_missing_trailers: Uncached streaming variant of this scan.
+
         Example:
             >>> scanner = MovieScanner()
             >>> missing = scanner.find_missing_trailers([Path("/movies")])
@@ -140,13 +158,46 @@ class MovieScanner:
             >>> # With sample mode
             >>> sample = scanner.find_missing_trailers([Path("/movies")], sample_size=3)
         """
+        base_paths = list(dict.fromkeys(paths or ()))
+        if sample_size or len(base_paths) < 2:
+            return list(self.iter_missing_trailers(paths, sample_size))
+
+        with ThreadPoolExecutor(max_workers=min(len(base_paths), MAX_SCAN_WORKERS)) as pool:
+            per_path = pool.map(lambda path: list(self.iter_missing_trailers([path])), base_paths)
+            return [item for missing in per_path for item in missing]
+
+    def iter_missing_trailers(self, paths: List[Path], sample_size: int = 0) -> Iterator[Path]:
+        """Yield movie directories missing trailer files as they are found.
+
+        Streaming, uncached counterpart of find_missing_trailers: each directory
+        is yielded as soon as it is identified, so callers can start working on
+        the first results without waiting for the whole library to be scanned.
+
+        Args:
+            paths: List of directory paths to scan for movies with missing trailers.
+            sample_size: Optional number of movie folders to scan (0 = scan all folders).
+
+        Returns:
+            Iterator of Path objects representing movie directories without trailers.
+
+        Raises:
+            ValueError: If paths is empty or None (raised immediately, not on iteration).
+        """
         if not paths:
             raise ValueError("Paths list cannot be empty")
 
-        missing_trailers = []
+        return self._scan_missing_trailers(paths, sample_size)
+
+    def _scan_missing_trailers(  # pylint: disable=too-many-branches
+        self, paths: List[Path], sample_size: int
+    ) -> Iterator[Path]:
+        """Generator backing iter_missing_trailers (see it for arguments)."""
+        missing_count = 0
         scanned_count = 0
 
-        for base_path in paths:
+        # A base path listed twice (e.g. in both env config and CLI) would classify
+        # every directory below it twice; dict.fromkeys drops repeats, keeping order
+        for base_path in dict.fromkeys(paths):
             if not base_path.exists():
                 logger.warning("Path does not exist: %s", base_path)
                 continue
@@ -160,42 +211,46 @@ class MovieScanner:
             try:
                 # Iterate through all subdirectories
                 checked_count = 0
-                for item in base_path.iterdir():
-                    # Check sample size limit - stop scanning if reached
-                    if 0 < sample_size <= scanned_count:
-                        logger.info(
-                            "Reached sample size limit (%d movies scanned, %d folders checked)",
-                            sample_size,
-                            checked_count,
-                        )
-                        break
-
-                    if not item.is_dir():
-                        continue
-
-                    checked_count += 1
-
-                    # Log progress every 100 folders
-                    if checked_count % 100 == 0:
-                        logger.info(
-                            "Progress: checked %d folders, found %d movies so far",
-                            checked_count,
-                            scanned_count,
-                        )
-
-                    # Check if it's a movie directory (has video files)
-                    if not self._has_video_files(item):
-                        logger.debug("Skipping non-movie directory: %s", item.name)
-                        continue
-
-                    # Count this as a scanned movie folder
-                    scanned_count += 1
-                    logger.info("Found movie #%d: %s", scanned_count, item.name)
-
-                    # Check if it has a trailer
-                    if not self.has_trailer(item):
-                        missing_trailers.append(item)
-                        logger.debug("Missing trailer in: %s", item)
+                with os.scandir(base_path) as entries:
+                    for entry in entries:
+                        # Check sample size limit - stop scanning if reached
+                        if 0 < sample_size <= scanned_count:
+                            logger.info(
+                                "Reached sample size limit "
+                                "(%d movies scanned, %d folders checked)",
+                                sample_size,
+                                checked_count,
+                            )
+                            break
+
+                        if not entry.is_dir():
+                            continue
+
+                        item = Path(entry.path)
+                        checked_count += 1
+
+                        # Log progress every 100 folders
+                        if checked_count % 100 == 0:
+                            logger.info(
+                                "Progress: checked %d folders, found %d movies so far",
+                                checked_count,
+                                scanned_count,
+                            )
+
+                        # Check if it's a movie directory (has video files)
+                        if not self._has_video_files(item):
+                            logger.debug("Skipping non-movie directory: %s", item.name)
+                            continue
+
+                        # Count this as a scanned movie folder
+                        scanned_count += 1
+                        logger.info("Found movie #%d: %s", scanned_count, item.name)
+
+                        # Check if it has a trailer
+                        if not self.has_trailer(item):
+                            missing_count += 1
+                            logger.debug("Missing trailer in: %s", item)
+                            yield item
 
             except PermissionError:
                 logger.error("Permission denied accessing: %s", base_path)
@@ -209,7 +264,5 @@ class MovieScanner:
         logger.info(
             "Scanned %d movie folders, found %d without trailers",
             scanned_count,
-            len(missing_trailers),
+            missing_count,
         )
-
-        return missing_trailers
@@ -13,8 +13,17 @@ Usage:
     movie_trailers = engine.search_movie("Inception", year=2010)
     tv_trailers = engine.search_tv_show("Breaking Bad", year=2008)
 
+    # Concurrent lookups for a whole library from synchronous code
+    trailers = engine.search_movies([("Inception", 2010), ("Tenet", 2020)])
+
+    # Concurrent lookups from asyncio code
+    results = await asyncio.gather(
+        *(engine.async_search_movie(title) for title in ["Inception", "Tenet"])
+    )
+
 Requirements:
     - requests library for HTTP API calls
+    - orjson (optional) for faster JSON decoding of API responses
     - Valid TMDB API key from https://www.themoviedb.org/settings/api
 
 References:
@@ -22,34 +31,90 @@ References:
     - Search Movies: https://developers.themoviedb.org/3/search/search-movies
     - Search TV Shows: https://developers.themoviedb.org/3/search/search-tv-shows
     - Get Videos: https://developers.themoviedb.org/3/movies/get-movie-videos
+    - Append To Response: https://developers.themoviedb.org/3/getting-started/append-to-response
 """
 
 from __future__ import annotations
 
+import asyncio
+import functools
+import random
+import threading
 import time
 import unicodedata
-from typing import Any, Optional
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, ClassVar, MutableMapping, Optional
 from urllib.parse import urljoin
 
-import requests
 from pydevmate import CacheIt
 
+# Fast JSON decoding with orjson when installed (fallback to stdlib json)
+try:
+    from orjson import loads as _loads  # pylint: disable=import-error,no-name-in-module
+except ImportError:  # pragma: no cover
+    from json import loads as _loads
+
+if TYPE_CHECKING:  # pragma: no cover
+    # requests (and urllib3, idna, charset_normalizer) is only imported once the
+    # first HTTP call is made, keeping package import cheap
+    import requests
+
+_YT_PREFIX = "https://www.youtube.com/watch?v="
+
+# Transient statuses retried by the session adapter (rate limiting and server errors)
+_RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+
+@functools.cache
+def _jittered_retry_class() -> type:
+    """Return a urllib3 Retry subclass that randomizes each backoff delay.
+
+    Built on first use so urllib3 is only imported along with requests. Each
+    delay is scaled by a random factor in [0.5, 1.5), then capped at
+    backoff_max, so clients that failed together do not retry in lockstep.
+    Retry-After headers still take precedence over the backoff.
+    """
+    from urllib3.util.retry import Retry  # pylint: disable=import-outside-toplevel
+
+    class JitteredRetry(Retry):
+        """Retry policy with randomized exponential backoff."""
+
+        def get_backoff_time(self) -> float:
+            """Return the exponential backoff delay scaled by a random factor."""
+            backoff = super().get_backoff_time() * random.uniform(0.5, 1.5)
+            return min(backoff, self.backoff_max)
+
+    return JitteredRetry
+
 
-class TMDBSearchEngine:
+class TMDBSearchEngine:  # pylint: disable=too-many-instance-attributes
     """Query TMDB API for official trailer YouTube URLs.
 
     This class provides methods to search for movies and TV shows on TMDB
     and retrieve their official trailer YouTube URLs. It handles API
-    authentication, rate limiting, and error handling.
+    authentication, rate limiting, and error handling. All engines share one
+    pooled requests.Session, so TMDB calls reuse keep-alive connections across
+    calls and across engine instances.
 
     Attributes:
         api_key: TMDB API key for authentication.
         base_url: Base URL for TMDB API (default: https://api.themoviedb.org/3).
         timeout: HTTP request timeout in seconds (default: 10).
         max_retries: Maximum number of retry attempts for failed requests (default: 3).
-        retry_delay: Delay between retry attempts in seconds (default: 1).
+        retry_delay: Backoff factor between retry attempts in seconds (default: 1).
+            Doubles on each attempt.
+        max_backoff: Upper bound for a single retry delay in seconds (default: 30).
+        search_cache_size: Number of (title, year) search results kept in memory (default: 512).
+        cache_ttl: Lifetime of cached API responses in seconds (default: 24 hours).
+        response_cache_size: Number of API responses kept by the default in-memory
+            response cache (default: 1024).
     """
 
+    # One pooled session per retry policy (max_retries, retry_delay, max_backoff)
+    _shared_sessions: ClassVar[dict[tuple[int, float, float], requests.Session]] = {}
+    _shared_session_lock: ClassVar[threading.Lock] = threading.Lock()
+
     def __init__(  # pylint: disable=too-many-arguments,too-many-positional-arguments
         self,
         api_key: str,
@@ -58,6 +123,12 @@ class TMDBSearchEngine:
         max_retries: int = 3,
         retry_delay: float = 1.0,
         languages: Optional[list[str]] = None,
+        cache: Optional[MutableMapping] = None,
+        cache_ttl: float = 86400,
+        max_backoff: float = 30.0,
+        search_cache_size: int = 512,
+        session: Optional[requests.Session] = None,
+        response_cache_size: int = 1024,
     ):
         """Initialize TMDBSearchEngine with API credentials.
 
@@ -66,9 +137,24 @@ class TMDBSearchEngine:
             base_url: Base URL for TMDB API endpoints.
             timeout: HTTP request timeout in seconds.
             max_retries: Maximum number of retry attempts for failed requests.
-            retry_delay: Delay between retry attempts in seconds.
+            retry_delay: Backoff factor between retry attempts in seconds.
             languages: List of TMDB language codes to try in order (e.g., ["fr-FR", "en-US"]).
                       Defaults to ["en-US"] if not provided.
+            cache: Mapping used to store raw API responses keyed by endpoint and params.
+                   Defaults to a per-instance in-memory cache bounded by
+                   response_cache_size; pass a diskcache.Cache to persist responses
+                   across runs (it then manages its own size).
+            cache_ttl: Lifetime of cached API responses in seconds.
+            max_backoff: Upper bound for a single retry delay in seconds.
+            search_cache_size: Maximum number of search results kept in the in-process
+                               LRU cache.
+            session: HTTP transport used for API calls. Any object exposing a
+                     requests-compatible get(url, params=..., timeout=...) works.
+                     Defaults to the shared pooled session for this engine's retry
+                     policy (see get_shared_session). The caller keeps ownership of
+                     a session passed in here, including its retry configuration.
+            response_cache_size: Maximum number of responses kept by the default
+                                 in-memory response cache.
 
         Raises:
             ValueError: If api_key is empty or None.
@@ -81,7 +167,86 @@ class TMDBSearchEngine:
         self.timeout = timeout
         self.max_retries = max_retries
         self.retry_delay = retry_delay
+        self.max_backoff = max_backoff
         self.languages = languages if languages else ["en-US"]
+        self.cache_ttl = cache_ttl
+        self.response_cache_size = response_cache_size
+        # The default store is kept in expiry order so it can be bounded (see
+        # _response_cache_put); an injected cache is left to manage itself
+        self._owns_cache = cache is None
+        self._cache: MutableMapping = cache if cache is not None else OrderedDict()
+        self._cache_lock = threading.Lock()
+        self.search_cache_size = search_cache_size
+        self._search_cache: OrderedDict[tuple, list[str]] = OrderedDict()
+        # Guards the LRU bookkeeping when searches run concurrently in worker threads
+        self._search_cache_lock = threading.Lock()
+
+        # Resolved lazily (see _session) so constructing an engine never loads requests
+        self._http_session = session
+
+    @property
+    def _session(self) -> requests.Session:
+        """HTTP session used for API calls: the injected one, else the shared pool."""
+        if self._http_session is None:
+            # Keep-alive session: search + detail calls hit the same host back to back
+            self._http_session = self.get_shared_session(
+                self.max_retries, self.retry_delay, self.max_backoff
+            )
+        return self._http_session
+
+    @classmethod
+    def get_shared_session(
+        cls, max_retries: int = 3, retry_delay: float = 1.0, max_backoff: float = 30.0
+    ) -> requests.Session:
+        """Return the process-wide pooled session for a retry policy.
+
+        Sharing sessions lets every engine instance reuse the same connection
+        pool (and its established TLS connections) to the TMDB API. Retries are
+        handled inside urllib3 by the mounted adapter: connection errors, timeouts
+        and 429/5xx responses are retried with jittered exponential backoff, and
+        the Retry-After header of 429/503 responses is honored.
+
+        Args:
+            max_retries: Total number of attempts per request (1 = no retry).
+            retry_delay: Backoff factor in seconds; doubles on each retry.
+            max_backoff: Upper bound for a single backoff delay in seconds.
+
+        Returns:
+            The shared requests.Session for this retry policy.
+        """
+        import requests  # pylint: disable=import-outside-toplevel,redefined-outer-name
+
+        key = (max_retries, retry_delay, max_backoff)
+        with cls._shared_session_lock:
+            session = cls._shared_sessions.get(key)
+            if session is None:
+                retry = _jittered_retry_class()(
+                    total=max(max_retries - 1, 0),
+                    backoff_factor=retry_delay,
+                    backoff_max=max_backoff,
+                    status_forcelist=_RETRY_STATUSES,
+                    allowed_methods=frozenset(["GET"]),
+                    respect_retry_after_header=True,
+                    # Hand the final error response back so raise_for_status() reports it
+                    raise_on_status=False,
+                )
+                session = requests.Session()
+                session.mount(
+                    "https://",
+                    requests.adapters.HTTPAdapter(
+                        pool_connections=4, pool_maxsize=16, max_retries=retry
+                    ),
+                )
+                cls._shared_sessions[key] = session
+            return session
+
+    @classmethod
+    def close_shared_session(cls) -> None:
+        """Close all shared sessions; the next engine will create fresh ones."""
+        with cls._shared_session_lock:
+            for session in cls._shared_sessions.values():
+                session.close()
+            cls._shared_sessions.clear()
 
     @staticmethod
     def _normalize_title(title: str) -> str:
@@ -117,7 +282,7 @@ class TMDBSearchEngine:
     def _make_request(
         self, endpoint: str, params: Optional[dict[str, Any]] = None
     ) -> dict[str, Any]:
-        """Make HTTP GET request to TMDB API with retry logic.
+        """Make HTTP GET request to TMDB API with response caching.
 
         Args:
             endpoint: API endpoint path (e.g., "/search/movie").
@@ -127,24 +292,83 @@ class TMDBSearchEngine:
             JSON response as dictionary.
 
         Raises:
-            requests.exceptions.RequestException: If request fails after all retries.
+            requests.exceptions.RequestException: If request fails after all retries
+                performed by the session adapter.
         """
+        # TMDB responses are stable over the cache TTL, so identical requests are
+        # answered locally instead of spending a round trip and rate-limit budget
+        cache_key = (endpoint, tuple(sorted((params or {}).items())))
+        cached = self._cache.get(cache_key)
+        if cached is not None and cached[0] > time.time():
+            return cached[1]
+
         url = urljoin(self.base_url + "/", endpoint.lstrip("/"))
         request_params = {"api_key": self.api_key}
         if params:
             request_params.update(params)
 
-        for attempt in range(self.max_retries):
-            try:
-                response = requests.get(url, params=request_params, timeout=self.timeout)
-                response.raise_for_status()
-                return response.json()
-            except requests.exceptions.RequestException:
-                if attempt == self.max_retries - 1:
-                    raise
-                time.sleep(self.retry_delay)
+        # Retries and backoff happen inside the session's adapter (see get_shared_session)
+        response = self._session.get(url, params=request_params, timeout=self.timeout)
+        response.raise_for_status()
+        data = _loads(response.content)
+        self._response_cache_put(cache_key, data)
+        return data
+
+    def _response_cache_put(self, key: tuple, data: dict[str, Any]) -> None:
+        """Store an API response until cache_ttl elapses.
+
+        All entries share one TTL, so the default store (ordered by insertion)
+        is also ordered by expiry: expired entries are dropped from its front,
+        then the oldest ones until at most response_cache_size remain.
 
-        return {}  # pragma: no cover - Should never reach here due to raise above
+        Args:
+            key: (endpoint, sorted params) tuple identifying the request.
+            data: Decoded JSON response.
+        """
+        now = time.time()
+        with self._cache_lock:
+            self._cache[key] = (now + self.cache_ttl, data)
+            if not self._owns_cache:
+                return
+            cache = self._cache
+            cache.move_to_end(key)
+            while cache and (
+                len(cache) > self.response_cache_size or next(iter(cache.values()))[0] <= now
+            ):
+                cache.popitem(last=False)
+
+    def _search_cache_get(self, key: tuple) -> Optional[list[str]]:
+        """Return a copy of a cached search result, marking it most recently used.
+
+        Args:
+            key: (media type, title, year) tuple identifying the search.
+
+        Returns:
+            Cached YouTube URLs, or None on cache miss.
+        """
+        with self._search_cache_lock:
+            urls = self._search_cache.get(key)
+            if urls is None:
+                return None
+            self._search_cache.move_to_end(key)
+            return list(urls)
+
+    def _search_cache_put(self, key: tuple, urls: list[str]) -> list[str]:
+        """Store a search result, evicting the least recently used entry if full.
+
+        Args:
+            key: (media type, title, year) tuple identifying the search.
+            urls: YouTube URLs found for the search.
+
+        Returns:
+            The urls argument, for convenient use in return statements.
+        """
+        with self._search_cache_lock:
+            self._search_cache[key] = list(urls)
+            self._search_cache.move_to_end(key)
+            if len(self._search_cache) > self.search_cache_size:
+                self._search_cache.popitem(last=False)
+        return urls
 
     def _extract_youtube_urls(self, videos: list[dict]) -> list[str]:
         """Extract YouTube URLs from TMDB video results.
@@ -155,13 +379,14 @@ class TMDBSearchEngine:
         Returns:
             List of YouTube URLs for trailers found.
         """
-        youtube_urls = []
-        for video in videos:
-            if video.get("site") == "YouTube" and video.get("type") == "Trailer":
-                video_key = video.get("key")
-                if video_key:
-                    youtube_urls.append(f"https://www.youtube.com/watch?v={video_key}")
-        return youtube_urls
+        # Cheap site/type rejects first; the key is fetched once and reused via walrus
+        return [
+            _YT_PREFIX + key
+            for video in videos
+            if video.get("site") == "YouTube"
+            and video.get("type") == "Trailer"
+            and (key := video.get("key"))
+        ]
 
     def _search_movie_with_language(
         self, title: str, year: Optional[int], language: str
@@ -180,9 +405,12 @@ class TMDBSearchEngine:
         Returns:
             Tuple of (movie_id, videos_list). Returns (None, []) if no results found.
         """
-        search_params: dict[str, Any] = {"query": title, "language": language}
-        if year:
-            search_params["year"] = year
+        # Built in one expression; year keeps truthiness semantics (0/None omitted)
+        search_params: dict[str, Any] = (
+            {"query": title, "language": language, "year": year}
+            if year
+            else {"query": title, "language": language}
+        )
 
         search_results = self._make_request("/search/movie", search_params)
         results = search_results.get("results", [])
@@ -204,8 +432,9 @@ class TMDBSearchEngine:
         if not movie_id:
             return None, []
 
-        videos_response = self._make_request(f"/movie/{movie_id}/videos")
-        videos = videos_response.get("results", [])
+        # Detail record with videos embedded, via TMDB's append_to_response
+        details = self._make_request(f"/movie/{movie_id}", {"append_to_response": "videos"})
+        videos = details.get("videos", {}).get("results", [])
 
         return movie_id, videos
 
@@ -226,9 +455,12 @@ class TMDBSearchEngine:
         Returns:
             Tuple of (tv_show_id, videos_list). Returns (None, []) if no results found.
         """
-        search_params: dict[str, Any] = {"query": title, "language": language}
-        if year:
-            search_params["first_air_date_year"] = year
+        # Built in one expression; year keeps truthiness semantics (0/None omitted)
+        search_params: dict[str, Any] = (
+            {"query": title, "language": language, "first_air_date_year": year}
+            if year
+            else {"query": title, "language": language}
+        )
 
         search_results = self._make_request("/search/tv", search_params)
         results = search_results.get("results", [])
@@ -250,8 +482,9 @@ class TMDBSearchEngine:
         if not tv_id:
             return None, []
 
-        videos_response = self._make_request(f"/tv/{tv_id}/videos")
-        videos = videos_response.get("results", [])
+        # Detail record with videos embedded, via TMDB's append_to_response
+        details = self._make_request(f"/tv/{tv_id}", {"append_to_response": "videos"})
+        videos = details.get("videos", {}).get("results", [])
 
         return tv_id, videos
 
@@ -275,9 +508,18 @@ class TMDBSearchEngine:
             >>> print(urls)
             ['https://www.youtube.com/watch?v=5WfTEZJnv_8']
         """
-        if not title:
+        # isspace() rejects whitespace-only titles without allocating a stripped copy
+        if not title or title.isspace():
             return []
 
+        # Repeated lookups (e.g. the same show across runs of a batch) skip the API
+        cache_key = ("movie", title, year)
+        cached = self._search_cache_get(cache_key)
+        if cached is not None:
+            return cached
+
+        import requests  # pylint: disable=import-outside-toplevel,redefined-outer-name
+
         try:
             # Try each language in order until we find results
             for language in self.languages:
@@ -286,12 +528,13 @@ class TMDBSearchEngine:
                 if movie_id and videos:
                     youtube_urls = self._extract_youtube_urls(videos)
                     if youtube_urls:
-                        return youtube_urls
+                        return self._search_cache_put(cache_key, youtube_urls)
 
             # No results found with any language
-            return []
+            return self._search_cache_put(cache_key, [])
 
         except requests.exceptions.RequestException:
+            # Not cached: transient API errors should be retried on the next call
             return []
 
     @CacheIt(max_duration=86400, backend="diskcache")  # 24 hour cache
@@ -314,9 +557,18 @@ class TMDBSearchEngine:
             >>> print(urls)
             ['https://www.youtube.com/watch?v=HhesaQXLuRY']
         """
-        if not title:
+        # isspace() rejects whitespace-only titles without allocating a stripped copy
+        if not title or title.isspace():
             return []
 
+        # Repeated lookups (e.g. the same show across runs of a batch) skip the API
+        cache_key = ("tv", title, year)
+        cached = self._search_cache_get(cache_key)
+        if cached is not None:
+            return cached
+
+        import requests  # pylint: disable=import-outside-toplevel,redefined-outer-name
+
         try:
             # Try each language in order until we find results
             for language in self.languages:
@@ -325,10 +577,141 @@ class TMDBSearchEngine:
                 if tv_id and videos:
                     youtube_urls = self._extract_youtube_urls(videos)
                     if youtube_urls:
-                        return youtube_urls
+                        return self._search_cache_put(cache_key, youtube_urls)
 
             # No results found with any language
-            return []
+            return self._search_cache_put(cache_key, [])
 
         except requests.exceptions.RequestException:
+            # Not cached: transient API errors should be retried on the next call
             return []
+
+    async def async_search_movie(self, title: str, year: Optional[int] = None) -> list[str]:
+        """Awaitable variant of search_movie for concurrent lookups.
+
+        The blocking search (including its cache) runs in a worker thread, so many
+        titles can be fanned out with asyncio.gather instead of waiting on each
+        TMDB round trip in turn.
+
+        Args:
+            title: Movie title to search for.
+            year: Optional release year to refine search results.
+
+        Returns:
+            List of YouTube URLs for movie trailers found on TMDB.
+
+        Example:
+            >>> urls_per_title = await asyncio.gather(
+            ...     engine.async_search_movie("Inception", 2010),
+            ...     engine.async_search_movie("Tenet", 2020),
+            ... )
+        """
+        return await asyncio.to_thread(self.search_movie, title, year)
+
+    async def async_search_tv_show(self, title: str, year: Optional[int] = None) -> list[str]:
+        """Awaitable variant of search_tv_show for concurrent lookups.
+
+        Args:
+            title: TV show title to search for.
+            year: Optional first air year to refine search results.
+
+        Returns:
+            List of YouTube URLs for TV show trailers found on TMDB.
+        """
+        return await asyncio.to_thread(self.search_tv_show, title, year)
+
+    def search_movies(
+        self, queries: list[tuple[str, Optional[int]]], max_concurrency: int = 20
+    ) -> list[list[str]]:
+        """Search trailers for many movies concurrently.
+
+        Must be called from synchronous code (it runs its own event loop); use
+        async_search_movie with asyncio.gather from inside a running loop.
+
+        Args:
+            queries: List of (title, year) tuples; year may be None.
+            max_concurrency: Maximum number of searches in flight at once, keeping
+                             the request rate within TMDB's limits.
+
+        Returns:
+            List of YouTube URL lists, in the same order as queries.
+
+        Example:
+            >>> engine.search_movies([("Inception", 2010), ("Tenet", None)])
+            [['https://www.youtube.com/watch?v=YoHD9XEInc0'], [...]]
+        """
+        return asyncio.run(
+            self._gather_searches(self.async_search_movie, queries, max_concurrency)
+        )
+
+    def search_tv_shows(
+        self, queries: list[tuple[str, Optional[int]]], max_concurrency: int = 20
+    ) -> list[list[str]]:
+        """Search trailers for many TV shows concurrently.
+
+        Args:
+            queries: List of (title, year) tuples; year may be None.
+            max_concurrency: Maximum number of searches in flight at once.
+
+        Returns:
+            List of YouTube URL lists, in the same order as queries.
+        """
+        return asyncio.run(
+            self._gather_searches(self.async_search_tv_show, queries, max_concurrency)
+        )
+
+    def search_many(
+        self,
+        queries: list[tuple[str, Optional[int]]],
+        kind: str = "movie",
+        max_workers: int = 10,
+    ) -> list[list[str]]:
+        """Search trailers for many titles concurrently using a thread pool.
+
+        Plain-threads alternative to search_movies/search_tv_shows for callers
+        that cannot run an event loop (for example, code already inside one).
+
+        Args:
+            queries: List of (title, year) tuples; year may be None.
+            kind: "movie" or "tv" to select search_movie or search_tv_show.
+            max_workers: Number of worker threads (searches in flight at once).
+
+        Returns:
+            List of YouTube URL lists, in the same order as queries.
+
+        Raises:
+            ValueError: If kind is not "movie" or "tv".
+        """
+        if kind == "movie":
+            search = self.search_movie
+        elif kind == "tv":
+            search = self.search_tv_show
+        else:
+            raise ValueError(f"Unknown search kind: {kind!r} (expected 'movie' or 'tv')")
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(lambda query: search(*query), queries))
+
+    @staticmethod
+    async def _gather_searches(
+        search: Callable[[str, Optional[int]], Awaitable[list[str]]],
+        queries: list[tuple[str, Optional[int]]],
+        max_concurrency: int,
+    ) -> list[list[str]]:
+        """Run search over all queries with at most max_concurrency in flight.
+
+        Args:
+            search: Awaitable search method (async_search_movie or async_search_tv_show).
+            queries: List of (title, year) tuples.
+            max_concurrency: Semaphore size bounding concurrent searches.
+
+        Returns:
+            Search results in query order.
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def bounded(title: str, year: Optional[int]) -> list[str]:
+            async with semaphore:
+                return await search(title, year)
+
+        return list(await asyncio.gather(*(bounded(title, year) for title, year in queries)))
@@ -25,8 +25,10 @@ Example:
 from __future__ import annotations
 
 import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List
+from typing import Iterator, List, NamedTuple, Union
 
 from pydevmate import CacheIt
 
@@ -35,6 +37,23 @@ logger = logging.getLogger(__name__)
 # Video file extensions to recognize
 VIDEO_EXTENSIONS = {".mp4", ".mkv", ".avi", ".m4v", ".mov"}
 
+# Directory argument accepted by the internal checks: scan loops pass the
+# os.DirEntry straight through and only wrap a Path for reported TV shows
+DirLike = Union[Path, "os.DirEntry[str]"]
+
+# Case-insensitive substring that marks a file as a trailer
+TRAILER_KEYWORD = "trailer"
+
+# Upper bound on base paths scanned concurrently by find_missing_trailers
+MAX_SCAN_WORKERS = 8
+
+
+class ShowInfo(NamedTuple):
+    """What a single inspection of a candidate TV show directory found."""
+
+    is_tvshow: bool
+    has_trailer: bool
+
 
 class TVShowScanner:
     """Scan TV show directories to detect missing trailer files.
@@ -77,7 +96,8 @@ class TVShowScanner:
                           Defaults to "season".
         """
         self.trailer_subdir = trailer_subdir
-        self.season_pattern = season_pattern.lower()
+        # casefold() rather than lower() so non-ASCII patterns match caselessly too
+        self.season_pattern = season_pattern.casefold()
         logger.debug(
             "TVShowScanner initialized (trailer_subdir: %s, season_pattern: %s)",
             trailer_subdir,
@@ -85,7 +105,7 @@ class TVShowScanner:
         )
 
     @staticmethod
-    def _has_video_files(directory: Path) -> bool:
+    def _has_video_files(directory: DirLike) -> bool:
         """Check if a directory contains any video files.
 
         Args:
@@ -95,14 +115,18 @@ class TVShowScanner:
             True if directory contains at least one video file, False otherwise.
         """
         try:
-            return any(
-                f.suffix.lower() in VIDEO_EXTENSIONS for f in directory.iterdir() if f.is_file()
-            )
+            with os.scandir(directory) as entries:
+                # Extension test first: DirEntry.is_file() may cost a stat() call
+                return any(
+                    os.path.splitext(entry.name)[1].lower() in VIDEO_EXTENSIONS
+                    and entry.is_file()
+                    for entry in entries
+                )
         except (PermissionError, OSError) as e:
             logger.warning("Error checking video files in %s: %s", directory, e)
             return False
 
-    def _has_subdirectories_with_videos(self, directory: Path) -> bool:
+    def _has_subdirectories_with_videos(self, directory: DirLike) -> bool:
         """Check if a directory has subdirectories containing video files.
 
         This is useful for detecting TV show directories which typically
@@ -115,15 +139,14 @@ class TVShowScanner:
             True if any subdirectory contains video files, False otherwise.
         """
         try:
-            for subdir in directory.iterdir():
-                if subdir.is_dir() and self._has_video_files(subdir):
-                    return True
-            return False
+            with os.scandir(directory) as entries:
+                # any() stops reading the listing at the first subdirectory with videos
+                return any(entry.is_dir() and self._has_video_files(entry) for entry in entries)
         except (PermissionError, OSError) as e:
             logger.warning("Error checking subdirectories in %s: %s", directory, e)
             return False
 
-    def _is_tvshow_directory(self, directory: Path) -> bool:
+    def _is_tvshow_directory(self, directory: DirLike) -> bool:
         """Determine if a directory is a TV show directory.
 
         A directory is considered a TV show directory if it contains
@@ -135,39 +158,68 @@ class TVShowScanner:
         Returns:
             True if directory appears to be a TV show directory, False otherwise.
         """
-        try:
-            has_matching_subdir = False
-            for subdir in directory.iterdir():
-                if not subdir.is_dir():
-                    continue
+        return self._inspect_show(directory, check_trailer=False).is_tvshow
 
-                subdir_lower = subdir.name.lower()
-                logger.debug(
-                    "Checking subdir '%s' - starts with '%s': %s",
-                    subdir.name,
-                    self.season_pattern,
-                    subdir_lower.startswith(self.season_pattern),
-                )
+    def _inspect_show(self, directory: DirLike, check_trailer: bool = True) -> ShowInfo:
+        """Classify a candidate directory and check its trailer from one listing.
+
+        While listing the directory for season subdirectories, the scan also
+        notes whether the trailers subdirectory exists, so shows without one are
+        reported as missing a trailer without probing for it.
+
+        Args:
+            directory: Candidate TV show directory.
+            check_trailer: Also check for a trailer. When False, the listing
+                stops at the first season directory holding videos and
+                has_trailer is always False.
+
+        Returns:
+            ShowInfo with is_tvshow and has_trailer (False for non-shows).
+        """
+        is_tvshow = False
+        has_matching_subdir = False
+        has_trailer_dir = False
+        season_pattern = self.season_pattern
+        # Case-insensitive like the exists() probe on macOS/SMB mounts, so a
+        # "Trailers" folder still counts there; has_trailer() does the real check
+        trailer_subdir = self.trailer_subdir.casefold()
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    name = entry.name
+                    if name.casefold() == trailer_subdir:
+                        has_trailer_dir = has_trailer_dir or entry.is_dir()
+                        continue
+                    # Cheap name test first so non-season entries (Extras, Artwork,
+                    # loose files...) are rejected before any type check
+                    if is_tvshow or not name.casefold().startswith(season_pattern):
+                        continue
+                    if not entry.is_dir():
+                        continue
 
-                if subdir_lower.startswith(self.season_pattern):
                     has_matching_subdir = True
-                    has_videos = self._has_video_files(subdir)
-                    logger.debug("Season dir '%s' has video files: %s", subdir.name, has_videos)
-                    if has_videos:
-                        return True
+                    is_tvshow = self._has_video_files(entry)
+                    logger.debug("Season dir '%s' has video files: %s", name, is_tvshow)
+                    if is_tvshow and not check_trailer:
+                        break
+        except (PermissionError, OSError) as e:
+            logger.warning("Error checking if TV show directory %s: %s", directory, e)
+            return ShowInfo(is_tvshow=False, has_trailer=False)
 
+        if not is_tvshow:
             if has_matching_subdir:
                 logger.debug("Directory '%s' has season dirs but no videos", directory.name)
             else:
                 logger.debug(
                     "Directory '%s' has no subdirs matching pattern '%s'",
                     directory.name,
-                    self.season_pattern,
+                    season_pattern,
                 )
-            return False
-        except (PermissionError, OSError) as e:
-            logger.warning("Error checking if TV show directory %s: %s", directory, e)
-            return False
+            return ShowInfo(is_tvshow=False, has_trailer=False)
+
+        # No trailers subdirectory seen in the listing: nothing left to probe
+        has_trailer = check_trailer and has_trailer_dir and self.has_trailer(Path(directory))
+        return ShowInfo(is_tvshow=True, has_trailer=has_trailer)
 
     def has_trailer(self, tvshow_dir: Path) -> bool:
         """Check if a TV show directory contains any trailer file.
@@ -183,25 +235,24 @@ class TVShowScanner:
         """
         trailer_dir = tvshow_dir / self.trailer_subdir
 
-        # Check if trailers directory exists
-        if not trailer_dir.exists() or not trailer_dir.is_dir():
-            return False
-
         try:
             # Look for any file containing 'trailer' in the trailers directory
-            for file_path in trailer_dir.iterdir():
-                if file_path.is_file() and "trailer" in file_path.name.lower():
-                    logger.debug("Trailer found in: %s (%s)", tvshow_dir, file_path.name)
-                    return True
+            with os.scandir(trailer_dir) as entries:
+                for entry in entries:
+                    # Name check first, then the d_type-backed is_file()
+                    if TRAILER_KEYWORD in entry.name.lower() and entry.is_file():
+                        logger.debug("Trailer found in: %s (%s)", tvshow_dir, entry.name)
+                        return True
+            return False
+        except (FileNotFoundError, NotADirectoryError):
+            # No trailers directory: the common case, not worth a warning
             return False
         except (PermissionError, OSError) as e:
             logger.warning("Error checking for trailer in %s: %s", tvshow_dir, e)
             return False
 
     @CacheIt(max_duration=86400, backend="diskcache")  # 24 hour cache
-    def find_missing_trailers(  # pylint: disable=too-many-branches
-        self, paths: List[Path], sample_size: int = 0
-    ) -> List[Path]:
+    def find_missing_trailers(self, paths: List[Path], sample_size: int = 0) -> List[Path]:
         """Find TV show directories that are missing trailer files.
 
         Scans the provided paths for TV show directories and identifies which ones
@@ -214,6 +265,9 @@ class TVShowScanner:
             The complete results list is cached - directory scanning AND
             trailer detection. Cache key includes sample_size to ensure different
             sample sizes use separate cache entries.
+            Without a sample size, base paths are scanned concurrently (one
+            thread each, up to MAX_SCAN_WORKERS): the scan is bound by directory
+            I/O, which releases the GIL. Results keep the order of paths.
 
         Args:
             paths: List of directory paths to scan for TV shows with missing trailers.
@@ -228,6 +282,9 @@ class TVShowScanner:
         Raises:
             ValueError: If paths is empty or None.
 
+        See Also:
+            iter_missing_trailers: Uncached streaming variant of this scan.
+
         Example:
             >>> scanner = TVShowScanner()
             >>> missing = scanner.find_missing_trailers([Path("/tvshows")])
@@ -235,13 +292,46 @@ class TVShowScanner:
             >>> # With sample mode
             >>> sample = scanner.find_missing_trailers([Path("/tvshows")], sample_size=3)
         """
+        base_paths = list(dict.fromkeys(paths or ()))
+        if sample_size or len(base_paths) < 2:
+            return list(self.iter_missing_trailers(paths, sample_size))
+
+        with ThreadPoolExecutor(max_workers=min(len(base_paths), MAX_SCAN_WORKERS)) as pool:
+            per_path = pool.map(lambda path: list(self.iter_missing_trailers([path])), base_paths)
+            return [item for missing in per_path for item in missing]
+
+    def iter_missing_trailers(self, paths: List[Path], sample_size: int = 0) -> Iterator[Path]:
+        """Yield TV show directories missing trailer files as they are found.
+
+        Streaming, uncached counterpart of find_missing_trailers: each directory
+        is yielded as soon as it is identified, so callers can start working on
+        the first results without waiting for the whole library to be scanned.
+
+        Args:
+            paths: List of directory paths to scan for TV shows with missing trailers.
+            sample_size: Optional number of TV show folders to scan (0 = scan all folders).
+
+        Returns:
+            Iterator of Path objects representing TV show directories without trailers.
+
+        Raises:
+            ValueError: If paths is empty or None (raised immediately, not on iteration).
+        """
         if not paths:
             raise ValueError("Paths list cannot be empty")
 
-        missing_trailers = []
+        return self._scan_missing_trailers(paths, sample_size)
+
+    def _scan_missing_trailers(  # pylint: disable=too-many-branches
+        self, paths: List[Path], sample_size: int
+    ) -> Iterator[Path]:
+        """Generator backing iter_missing_trailers (see it for arguments)."""
+        missing_count = 0
         scanned_count = 0
 
-        for base_path in paths:
+        # A base path listed twice (e.g. in both env config and CLI) would classify
+        # every directory below it twice; dict.fromkeys drops repeats, keeping order
+        for base_path in dict.fromkeys(paths):
             if not base_path.exists():
                 logger.warning("Path does not exist: %s", base_path)
                 continue
@@ -255,42 +345,46 @@ class TVShowScanner:
             try:
                 # Iterate through all subdirectories
                 checked_count = 0
-                for item in base_path.iterdir():
-                    # Check sample size limit - stop scanning if reached
-                    if 0 < sample_size <= scanned_count:
-                        logger.info(
-                            "Reached sample size limit (%d TV shows scanned, %d folders checked)",
-                            sample_size,
-                            checked_count,
-                        )
-                        break
-
-                    if not item.is_dir():
-                        continue
-
-                    checked_count += 1
-
-                    # Log progress every 100 folders
-                    if checked_count % 100 == 0:
-                        logger.info(
-                            "Progress: checked %d folders, found %d TV shows so far",
-                            checked_count,
-                            scanned_count,
-                        )
-
-                    # Check if it's a TV show directory
-                    if not self._is_tvshow_directory(item):
-                        logger.debug("Skipping non-TV-show directory: %s", item.name)
-                        continue
-
-                    # Count this as a scanned TV show folder
-                    scanned_count += 1
-                    logger.info("Found TV show #%d: %s", scanned_count, item.name)
-
-                    # Check if it has a trailer
-                    if not self.has_trailer(item):
-                        missing_trailers.append(item)
-                        logger.debug("Missing trailer in: %s", item)
+                with os.scandir(base_path) as entries:
+                    for entry in entries:
+                        # Check sample size limit - stop scanning if reached
+                        if 0 < sample_size <= scanned_count:
+                            logger.info(
+                                "Reached sample size limit "
+                                "(%d TV shows scanned, %d folders checked)",
+                                sample_size,
+                                checked_count,
+                            )
+                            break
+
+                        if not entry.is_dir():
+                            continue
+
+                        checked_count += 1
+
+                        # Log progress every 100 folders
+                        if checked_count % 100 == 0:
+                            logger.info(
+                                "Progress: checked %d folders, found %d TV shows so far",
+                                checked_count,
+                                scanned_count,
+                            )
+
+                        # Classify the directory and check its trailer together
+                        info = self._inspect_show(entry)
+                        if not info.is_tvshow:
+                            logger.debug("Skipping non-TV-show directory: %s", entry.name)
+                            continue
+
+                        # Count this as a scanned TV show folder
+                        scanned_count += 1
+                        logger.info("Found TV show #%d: %s", scanned_count, entry.name)
+
+                        if not info.has_trailer:
+                            item = Path(entry.path)
+                            missing_count += 1
+                            logger.debug("Missing trailer in: %s", item)
+                            yield item
 
             except PermissionError:
                 logger.error("Permission denied accessing: %s", base_path)
@@ -304,7 +398,5 @@ class TVShowScanner:
         logger.info(
             "Scanned %d TV show folders, found %d without trailers",
             scanned_count,
-            len(missing_trailers),
+            missing_count,
         )
-
-        return missing_trailers
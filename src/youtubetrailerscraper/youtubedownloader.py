@@ -23,8 +23,11 @@ References:
 from __future__ import annotations
 
 import logging
+import os
+from contextlib import ExitStack
 from pathlib import Path
-from typing import Optional
+from types import MappingProxyType
+from typing import Any, Optional
 
 import yt_dlp
 
@@ -35,6 +38,20 @@ class YoutubeDownloader:
     # Maximum number of trailers to download per movie or TV show
     MAX_TRAILERS_PER_MEDIA = 3
 
+    # yt-dlp options shared by every download (MP4, max 1080p); read-only so
+    # each download overlays its outtmpl and cookies on a fresh copy
+    _BASE_OPTS = MappingProxyType(
+        {
+            "format": (
+                "bestvideo[ext=mp4][height<=1080]+bestaudio[ext=m4a]/"
+                "best[ext=mp4][height<=1080]/best"
+            ),
+            "quiet": True,
+            "no_warnings": True,
+            "merge_output_format": "mp4",
+        }
+    )
+
     def __init__(
         self,
         logger: Optional[logging.Logger] = None,
@@ -58,6 +75,27 @@ class YoutubeDownloader:
         self.cookies_from_browser = cookies_from_browser
         self.cookies_file = cookies_file
 
+    def _build_ydl_opts(self, outtmpl: str) -> dict[str, Any]:
+        """Build yt-dlp options for an MP4 (max 1080p) download.
+
+        Args:
+            outtmpl: Output template (the full path of the .mp4 file).
+
+        Returns:
+            Options dictionary for yt_dlp.YoutubeDL.
+        """
+        ydl_opts: dict[str, Any] = {**self._BASE_OPTS, "outtmpl": outtmpl}
+
+        # Add cookie support to bypass YouTube bot detection
+        if self.cookies_from_browser:
+            ydl_opts["cookiesfrombrowser"] = (self.cookies_from_browser,)
+            self.logger.debug(f"Using cookies from browser: {self.cookies_from_browser}")
+        elif self.cookies_file:
+            ydl_opts["cookiefile"] = self.cookies_file
+            self.logger.debug(f"Using cookies file: {self.cookies_file}")
+
+        return ydl_opts
+
     def download(self, url: str, output_dir: Path, output_filename: str) -> Optional[Path]:
         """Download video from YouTube using yt-dlp.
 
@@ -86,46 +124,63 @@ class YoutubeDownloader:
             self.logger.warning("Empty URL provided, skipping download")
             return None
 
-        # Ensure output directory exists
-        output_dir.mkdir(parents=True, exist_ok=True)
+        paths = self._download_many([(url, output_filename)], output_dir)
+        return paths[0] if paths else None
 
-        # Full output path with .mp4 extension
-        output_path = output_dir / f"{output_filename}.mp4"
+    def _download_many(self, jobs: list[tuple[str, str]], output_dir: Path) -> list[Path]:
+        """Download several videos into one directory through a single YoutubeDL.
 
-        # Skip if file already exists
-        if output_path.exists():
-            self.logger.info(f"File already exists, skipping: {output_path}")
-            return output_path
+        The YoutubeDL instance (options parsing, extractor setup) is created
+        once, on the first file that actually needs downloading, and its output
+        template is switched per URL. Existing files are detected from one
+        listing of output_dir rather than a stat() per job. A failed URL is
+        logged and does not stop the remaining ones.
 
-        # Configure yt-dlp options
-        ydl_opts = {
-            "format": (
-                "bestvideo[ext=mp4][height<=1080]+bestaudio[ext=m4a]/"
-                "best[ext=mp4][height<=1080]/best"
-            ),
-            "outtmpl": str(output_path),  # Include .mp4 extension in output path
-            "quiet": True,
-            "no_warnings": True,
-            "merge_output_format": "mp4",
-        }
+        Args:
+            jobs: (url, output_filename) pairs; filenames are without extension.
+            output_dir: Directory where the videos should be saved.
 
-        # Add cookie support to bypass YouTube bot detection
-        if self.cookies_from_browser:
-            ydl_opts["cookiesfrombrowser"] = (self.cookies_from_browser,)
-            self.logger.debug(f"Using cookies from browser: {self.cookies_from_browser}")
-        elif self.cookies_file:
-            ydl_opts["cookiefile"] = self.cookies_file
-            self.logger.debug(f"Using cookies file: {self.cookies_file}")
+        Returns:
+            Paths of downloaded or already existing videos, in job order.
+        """
+        # Ensure output directory exists
+        output_dir.mkdir(parents=True, exist_ok=True)
+        with os.scandir(output_dir) as entries:
+            existing_names = {entry.name for entry in entries}
+        # Join as strings in the loop; yt-dlp wants str and Path is only needed for results
+        base = os.path.join(output_dir, "")
 
-        try:
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                self.logger.info(f"Downloading: {url} -> {output_path}")
-                ydl.download([url])
-            self.logger.info(f"Successfully downloaded: {output_path}")
-            return output_path
-        except Exception as e:  # pylint: disable=broad-except
-            self.logger.error(f"Failed to download {url}: {e}")
-            return None
+        downloaded_paths = []
+        with ExitStack() as stack:
+            ydl = None
+            for url, output_filename in jobs:
+                if not url:
+                    self.logger.warning("Empty URL provided, skipping download")
+                    continue
+
+                # Full output path with .mp4 extension
+                filename = f"{output_filename}.mp4"
+                output_path = f"{base}{filename}"
+                if filename in existing_names:
+                    self.logger.info(f"File already exists, skipping: {output_path}")
+                    downloaded_paths.append(Path(output_path))
+                    continue
+
+                try:
+                    if ydl is None:
+                        ydl_opts = self._build_ydl_opts(output_path)
+                        ydl = stack.enter_context(yt_dlp.YoutubeDL(ydl_opts))
+                    # YoutubeDL normalizes outtmpl to its documented {type: template}
+                    # dict form (yt-dlp>=2024.10); retarget only the video template
+                    ydl.params["outtmpl"]["default"] = output_path
+                    self.logger.info(f"Downloading: {url} -> {output_path}")
+                    ydl.download([url])
+                    self.logger.info(f"Successfully downloaded: {output_path}")
+                    downloaded_paths.append(Path(output_path))
+                except Exception as e:  # pylint: disable=broad-except
+                    self.logger.error(f"Failed to download {url}: {e}")
+
+        return downloaded_paths
 
     def download_trailers_for_movie(self, movie_path: Path, youtube_urls: list[str]) -> list[Path]:
         """Download trailers for a movie to its directory.
@@ -163,13 +218,11 @@ class YoutubeDownloader:
             )
 
         movie_name = movie_path.name
-        downloaded_paths = []
-
-        for idx, url in enumerate(urls_to_download, start=1):
-            filename = f"{movie_name} - trailer #{idx} -trailer"
-            downloaded_path = self.download(url, movie_path, filename)
-            if downloaded_path:
-                downloaded_paths.append(downloaded_path)
+        jobs = [
+            (url, f"{movie_name} - trailer #{idx} -trailer")
+            for idx, url in enumerate(urls_to_download, start=1)
+        ]
+        downloaded_paths = self._download_many(jobs, movie_path)
 
         self.logger.info(
             f"Downloaded {len(downloaded_paths)}/{len(urls_to_download)}"
@@ -215,13 +268,8 @@ class YoutubeDownloader:
 
         trailers_dir = tvshow_path / "trailers"
         tvshow_name = tvshow_path.name
-        downloaded_paths = []
-
-        for idx, url in enumerate(urls_to_download, start=1):
-            filename = f"trailer #{idx}"
-            downloaded_path = self.download(url, trailers_dir, filename)
-            if downloaded_path:
-                downloaded_paths.append(downloaded_path)
+        jobs = [(url, f"trailer #{idx}") for idx, url in enumerate(urls_to_download, start=1)]
+        downloaded_paths = self._download_many(jobs, trailers_dir)
 
         self.logger.info(
             f"Downloaded {len(downloaded_paths)}/{len(urls_to_download)}"
@@ -29,7 +29,7 @@ import logging
 import os
 import re
 from pathlib import Path
-from typing import Optional
+from typing import Any, Mapping, Optional
 
 from dotenv import load_dotenv
 
@@ -47,6 +47,9 @@ class YoutubeTrailerScraper:  # pylint: disable=too-many-instance-attributes
         env_file: Optional[str] = None,
         use_smb: bool = False,
         logger: Optional[logging.Logger] = None,
+        tmdb_search_engine: Optional[TMDBSearchEngine] = None,
+        youtube_downloader: Optional[YoutubeDownloader] = None,
+        config: Optional[Mapping[str, Any]] = None,
     ):
         """
         Initialize YoutubeTrailerScraper
@@ -57,6 +60,14 @@ class YoutubeTrailerScraper:  # pylint: disable=too-many-instance-attributes
                 overridden by USE_SMB_MOUNT environment variable. Defaults to False.
             logger (logging.Logger, optional): Logger instance for logging. If None, uses a
                 NullHandler (no logging output). Pass a configured logger to enable logging.
+            tmdb_search_engine (TMDBSearchEngine, optional): Search engine to use instead of
+                building one from the TMDB settings (e.g. a stub in tests).
+            youtube_downloader (YoutubeDownloader, optional): Downloader to use instead of
+                building one from the YouTube cookie settings (e.g. a stub in tests).
+            config (Mapping, optional): Settings keyed like the .env variables, used
+                instead of the .env file and the process environment (env_file is then
+                ignored). Values may be given as in a .env file (strings) or as Python
+                values, e.g. {"MOVIES_PATHS": [Path("/movies")], "SCAN_SAMPLE_SIZE": 10}.
         """
         # Configuration attributes
         self.tmdb_api_key: str = ""
@@ -79,18 +90,22 @@ class YoutubeTrailerScraper:  # pylint: disable=too-many-instance-attributes
             self.logger.addHandler(logging.NullHandler())
 
         # Load environment variables first
+        self._config: Optional[Mapping[str, Any]] = config
         self._load_environment_variables(env_file)
 
         # Initialize TMDB search engine
-        self.tmdb_search_engine = TMDBSearchEngine(
+        self.tmdb_search_engine = tmdb_search_engine or TMDBSearchEngine(
             api_key=self.tmdb_api_key,
             base_url=self.tmdb_api_base_url,
             languages=self.tmdb_languages,
         )
 
+        # Initialize YouTube downloader with cookie configuration
+        self.youtube_downloader = youtube_downloader or self._build_youtube_downloader()
+
     def _load_environment_variables(self, env_file: Optional[str] = None) -> None:
         """
-        Load environment variables from .env file
+        Load environment variables from .env file, or from the config mapping if given
 
         Parameters:
             env_file (str, optional): Path to .env file
@@ -99,18 +114,22 @@ class YoutubeTrailerScraper:  # pylint: disable=too-many-instance-attributes
             FileNotFoundError: If .env file is not found
             ValueError: If required environment variables are missing
         """
-        # Load .env file
-        env_path = env_file or ".env"
-        self.logger.debug(f"Loading environment from: {env_path}")
-
-        if not Path(env_path).exists():
-            raise FileNotFoundError(
-                f"Environment file not found: {env_path}. "
-                "Please create a .env file based on .env.example"
-            )
+        if self._config is not None:
+            # Settings come straight from the mapping: no file to read
+            self.logger.debug("Loading configuration from the given mapping")
+        else:
+            # Load .env file
+            env_path = env_file or ".env"
+            self.logger.debug(f"Loading environment from: {env_path}")
+
+            if not Path(env_path).exists():
+                raise FileNotFoundError(
+                    f"Environment file not found: {env_path}. "
+                    "Please create a .env file based on .env.example"
+                )
 
-        # Load the environment file
-        load_dotenv(env_path, override=True)
+            # Load the environment file
+            load_dotenv(env_path, override=True)
 
         # Load TMDB API configuration
         self.logger.debug("Loading TMDB API configuration...")
@@ -196,13 +215,13 @@ class YoutubeTrailerScraper:  # pylint: disable=too-many-instance-attributes
         )
         self.youtube_cookies_file = self._get_env_var("YOUTUBE_COOKIES_FILE", default="")
 
-        # Initialize YouTube downloader with cookie configuration
-        self.youtube_downloader = YoutubeDownloader(
-            logger=self.logger,
-            cookies_from_browser=self.youtube_cookies_from_browser or None,
-            cookies_file=self.youtube_cookies_file or None,
-        )
+    def _build_youtube_downloader(self) -> YoutubeDownloader:
+        """
+        Build the YouTube downloader from the loaded cookie configuration
 
+        Returns:
+            YoutubeDownloader: Downloader using this scraper's logger and cookies
+        """
         if self.youtube_cookies_from_browser:  # pragma: no cover
             # pylint: disable=logging-fstring-interpolation
             self.logger.debug(
@@ -215,10 +234,20 @@ class YoutubeTrailerScraper:  # pylint: disable=too-many-instance-attributes
                 f"YouTube downloader configured with cookies file:" f" {self.youtube_cookies_file}"
             )
 
+        return YoutubeDownloader(
+            logger=self.logger,
+            cookies_from_browser=self.youtube_cookies_from_browser or None,
+            cookies_file=self.youtube_cookies_file or None,
+        )
+
     def _get_env_var(self, key: str, required: bool = False, default: str = "") -> str:
         """
         Get environment variable with error handling
 
+        Reads the config mapping instead of the environment when one was given.
+        Its values are returned as they would appear in a .env file, so they go
+        through the same parsing; a None value counts as unset.
+
         Parameters:
             key (str): Environment variable key
             required (bool): Whether the variable is required
@@ -230,7 +259,18 @@ class YoutubeTrailerScraper:  # pylint: disable=too-many-instance-attributes
         Raises:
             ValueError: If required variable is missing
         """
-        value = os.getenv(key, default)
+        if self._config is None:
+            value = os.getenv(key, default)
+        else:
+            raw = self._config.get(key)
+            if raw is None:
+                # A None value means unset, not the string "None"
+                value = default
+            elif isinstance(raw, (list, tuple)):
+                # Same Python list literal as in a .env file; str() also covers Path items
+                value = repr([str(item) for item in raw])
+            else:
+                value = str(raw)
         if required and not value:
             raise ValueError(
                 f"Required environment variable '{key}' is not set. "
@@ -493,8 +533,8 @@ class YoutubeTrailerScraper:  # pylint: disable=too-many-instance-attributes
             >>> print(urls)
             ['https://www.youtube.com/watch?v=YoHD9XEInc0']
         """
+        # Cheapest possible exit: empty titles are common for malformed folder names
         if not title:
-            self.logger.warning("Empty title provided for movie trailer search")
             return []
 
         # pylint: disable=logging-fstring-interpolation
@@ -537,8 +577,8 @@ class YoutubeTrailerScraper:  # pylint: disable=too-many-instance-attributes
             >>> print(urls)
             ['https://www.youtube.com/watch?v=HhesaQXLuRY']
         """
+        # Cheapest possible exit: empty titles are common for malformed folder names
         if not title:
-            self.logger.warning("Empty title provided for TV show trailer search")
             return []
 
         # pylint: disable=logging-fstring-interpolation
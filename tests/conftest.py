@@ -1,11 +1,319 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 """Fixtures and configuration for pytest."""
+import functools
+import json
 import os
+import shutil
+import stat
 import sys
+from pathlib import Path
+
+import pytest
 
 # Ensure src/ is on sys.path for imports in tests
 ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir))
 SRC = os.path.join(ROOT, "src")
 if SRC not in sys.path:
     sys.path.insert(0, SRC)
+
+
+# tmpfs used for tmp_path trees, and the free space below which it is left alone
+SHM_DIR = "/dev/shm"
+SHM_MIN_FREE = 256 * 1024 * 1024
+# Set when pytest_configure redirected PYTEST_DEBUG_TEMPROOT, so it can be undone
+_SHM_TEMPROOT_SET = pytest.StashKey[bool]()
+
+
+def _shm_usable():
+    """Return True when SHM_DIR is a writable directory with SHM_MIN_FREE bytes free."""
+    if not (os.path.isdir(SHM_DIR) and os.access(SHM_DIR, os.W_OK)):
+        return False
+    stats = os.statvfs(SHM_DIR)
+    return stats.f_bavail * stats.f_frsize >= SHM_MIN_FREE
+
+
+def pytest_configure(config):
+    """Keep tmp_path trees on tmpfs (/dev/shm) on Linux when it is usable.
+
+    The scanner tests are dominated by mkdir/create calls, which on tmpfs never
+    reach the block layer. /dev/shm is missing or tiny on some CI runners and
+    containers; the default temp root is kept then. An explicit --basetemp or
+    PYTEST_DEBUG_TEMPROOT wins.
+    """
+    if config.option.basetemp or "PYTEST_DEBUG_TEMPROOT" in os.environ:
+        return
+    if sys.platform.startswith("linux") and _shm_usable():
+        os.environ["PYTEST_DEBUG_TEMPROOT"] = SHM_DIR
+        config.stash[_SHM_TEMPROOT_SET] = True
+
+
+def pytest_unconfigure(config):
+    """Undo the PYTEST_DEBUG_TEMPROOT redirect made by pytest_configure."""
+    if config.stash.get(_SHM_TEMPROOT_SET, False):
+        os.environ.pop("PYTEST_DEBUG_TEMPROOT", None)
+
+
+def _mkempty(path):
+    """Create an empty file; file bodies are irrelevant to the scanners.
+
+    Uses a single mknod() syscall where the platform allows it for regular
+    files (Linux), else falls back to open()/close() (cheaper than Path.touch).
+    """
+    try:
+        os.mknod(path, stat.S_IFREG | 0o644)
+    except (AttributeError, OSError):  # no os.mknod (Windows), refused (macOS), or exists
+        os.close(os.open(path, os.O_WRONLY | os.O_CREAT, 0o644))
+
+
+# Path segments shared by the TV show trees built below and in the tests
+SEASON01 = "Season 01"
+EPISODE1 = "episode1.mp4"
+TRAILERS_DIR = "trailers"
+
+
+def make_show(parent, name, *, trailer=None, season=SEASON01, episode=EPISODE1):
+    """Create a TV show directory holding one episode in one season.
+
+    Args:
+        parent: Directory to create the show in.
+        name: Show directory name.
+        trailer: Trailer path relative to the show directory, e.g.
+            "trailers/show-trailer.mp4". None creates no trailer directory and a
+            trailing "/" creates an empty one.
+        season: Season subdirectory name.
+        episode: Episode file name inside the season directory.
+
+    Returns:
+        Path to the show directory.
+    """
+    show_dir = os.path.join(parent, name)
+    season_dir = os.path.join(show_dir, season)
+    os.makedirs(season_dir, exist_ok=True)
+    _mkempty(os.path.join(season_dir, episode))
+    if trailer is not None:
+        trailer_dir, trailer_name = trailer.split("/")
+        os.makedirs(os.path.join(show_dir, trailer_dir), exist_ok=True)
+        if trailer_name:
+            _mkempty(os.path.join(show_dir, trailer_dir, trailer_name))
+    return Path(show_dir)
+
+
+THREE_SHOWS = ("Show0", "Show1", "Show2")
+
+# Canonical TV show scenarios: base directory -> {show name: trailer path}.
+# The trailer path is relative to the show directory; None means no trailer
+# directory at all and a trailing "/" means an empty trailer directory.
+# Every show gets "Season 01/episode1.mp4".
+TVSHOW_LIBRARY_LAYOUT = {
+    "single": {"Breaking Bad": "trailers/breaking-bad-trailer.mp4", "The Wire": None},
+    "disk1": {"Show1": None},
+    "disk2": {"Show2": None},
+    # The same three shows, with and without trailers
+    "all_trailers": {show: f"trailers/{show.lower()}-trailer.mp4" for show in THREE_SHOWS},
+    "no_trailers": dict.fromkeys(THREE_SHOWS),
+    "custom_subdir": {"Show1": "videos/show1-trailer.mp4", "Show2": None},
+    # One show per trailer-naming case; see the trailer_case table in test_tvshowscanner
+    "shows": {
+        "standard": "trailers/show-trailer.mp4",
+        "uppercase": "trailers/SHOW-TRAILER.mp4",
+        "mixed_case": "trailers/Show-Trailer.mp4",
+        "mkv": "trailers/show-trailer.mkv",
+        "avi": "trailers/show-trailer.avi",
+        "official": "trailers/official-trailer.mp4",
+        "resolution": "trailers/show-trailer-1080p.mp4",
+        "no_dash": "trailers/ShowTrailer.mp4",
+        "spaced": "trailers/Show Trailer.mkv",
+        "just_trailer": "trailers/trailer.mp4",
+        "preview": "trailers/show-preview.mp4",
+        "empty_trailers": "trailers/",
+        "no_trailers_dir": None,
+    },
+}
+
+
+# Required settings shared by the test .env files; fill in the two path lists
+# with str.format and append any other settings after formatting
+BASE_ENV_TEMPLATE = (
+    "TMDB_API_KEY=test_api_key\n"
+    "TMDB_READ_ACCESS_TOKEN=test_token\n"
+    "MOVIES_PATHS={movies}\n"
+    "TVSHOWS_PATHS={tvshows}\n"
+)
+DEFAULT_MOVIES_PATHS = '["/path/to/movies/"]'
+DEFAULT_TVSHOWS_PATHS = '["/path/to/tvshows/"]'
+
+
+def paths_literal(*directories):
+    """Format directories as a MOVIES_PATHS / TVSHOWS_PATHS list literal.
+
+    json.dumps quotes and escapes each path, so directories containing quotes
+    or backslashes still parse; a JSON list of strings is a valid Python literal.
+
+    Args:
+        *directories: Directories (str or Path); each gets a trailing slash.
+
+    Returns:
+        The list literal, e.g. '["/tmp/movies/"]'.
+    """
+    return json.dumps([os.fspath(directory) + "/" for directory in directories])
+
+
+def write_env(directory, extra="", *, movies=DEFAULT_MOVIES_PATHS, tvshows=DEFAULT_TVSHOWS_PATHS):
+    """Write a .env file from BASE_ENV_TEMPLATE in a single write.
+
+    Args:
+        directory: Directory to create the .env file in.
+        extra: Further "KEY=value\\n" lines, appended verbatim.
+        movies: MOVIES_PATHS value (a Python list literal).
+        tvshows: TVSHOWS_PATHS value (a Python list literal).
+
+    Returns:
+        Path of the .env file, as a string.
+    """
+    env_file = os.path.join(directory, ".env")
+    with open(env_file, "w", encoding="utf-8") as f:
+        f.write(BASE_ENV_TEMPLATE.format(movies=movies, tvshows=tvshows) + extra)
+    return env_file
+
+
+@pytest.fixture(scope="session")
+def movies_library_101(tmp_path_factory):
+    """Build a read-only library of 101 movie folders once per session.
+
+    Structure:
+        movies/
+            Movie000/movie.mp4
+            ...
+            Movie100/movie.mp4
+    """
+    movies = tmp_path_factory.mktemp("lib101") / "movies"
+    os.mkdir(movies)
+    for i in range(101):
+        movie = os.path.join(movies, f"Movie{i:03d}")
+        os.mkdir(movie)
+        _mkempty(os.path.join(movie, "movie.mp4"))
+    return movies
+
+
+@pytest.fixture(scope="session")
+def tvshows_library_101(tmp_path_factory):
+    """Build a read-only library of 101 TV show folders once per session.
+
+    Structure:
+        tvshows/
+            Show000/Season 01/episode.mp4
+            ...
+            Show100/Season 01/episode.mp4
+    """
+    tvshows = tmp_path_factory.mktemp("lib101") / "tvshows"
+    os.mkdir(tvshows)
+    for i in range(101):
+        make_show(tvshows, f"Show{i:03d}", episode="episode.mp4")
+    return tvshows
+
+
+@pytest.fixture(scope="session")
+def tvshow_library(tmp_path_factory):
+    """Build the canonical TV show scenarios of TVSHOW_LIBRARY_LAYOUT once per session.
+
+    Tests must treat the library as read-only; clone a scenario with the
+    clone_tvshow_scenario fixture before modifying it.
+
+    Returns:
+        Root path; each TVSHOW_LIBRARY_LAYOUT key is a base directory below it.
+    """
+    root = tmp_path_factory.mktemp("tvshow_library")
+    for scenario, shows in TVSHOW_LIBRARY_LAYOUT.items():
+        base = os.path.join(root, scenario)
+        os.mkdir(base)
+        for show, trailer in shows.items():
+            make_show(base, show, trailer=trailer)
+    return root
+
+
+@pytest.fixture
+def clone_tvshow_scenario(tmp_path, tvshow_library):
+    """Return a function that clones a tvshow_library scenario into tmp_path.
+
+    The copy hardlinks the (empty) files instead of copying them, so a clone
+    costs one mkdir per directory and one link per file. Use it when a test
+    needs to modify a scenario or needs a path of its own (e.g. to avoid
+    sharing find_missing_trailers cache entries).
+    """
+
+    def clone(scenario):
+        return Path(
+            shutil.copytree(tvshow_library / scenario, tmp_path / scenario, copy_function=os.link)
+        )
+
+    return clone
+
+
+# Scrapers built by scraper_factory, reset before each test by reset_shared_scrapers
+_SHARED_SCRAPERS = []
+
+
+@pytest.fixture(autouse=True)
+def reset_shared_scrapers():
+    """Empty the TMDB engine caches of the session-shared scrapers before each test.
+
+    monkeypatch only undoes explicit patches; search results and API responses
+    cached inside a shared engine by one test would otherwise be served to the
+    next, making outcomes depend on test order and xdist distribution.
+    """
+    # pylint: disable=protected-access
+    for shared in _SHARED_SCRAPERS:
+        engine = shared.tmdb_search_engine
+        engine._cache.clear()
+        engine._search_cache.clear()
+
+
+@pytest.fixture(scope="session")
+def scraper_factory():
+    """Return a builder of YoutubeTrailerScraper instances, cached per settings.
+
+    Each distinct combination of settings builds one scraper for the whole
+    session; later calls with the same arguments get the same instance back.
+    Settings are passed as a config mapping, so no .env file is written and
+    nothing in os.environ (e.g. loaded by other tests' env files) leaks in.
+
+    Instances are shared: tests must only alter them through monkeypatch or
+    mocker, which undo their changes after the test. The TMDB engine's
+    in-memory caches are emptied before every test (see reset_shared_scrapers).
+
+    The builder takes movies and tvshows (MOVIES_PATHS / TVSHOWS_PATHS list
+    literals), sample_size (SCAN_SAMPLE_SIZE, "" for none) and use_smb.
+    """
+    # pylint: disable=import-outside-toplevel
+    from youtubetrailerscraper import YoutubeTrailerScraper
+
+    @functools.lru_cache(maxsize=16)
+    def build(
+        movies=DEFAULT_MOVIES_PATHS, tvshows=DEFAULT_TVSHOWS_PATHS, sample_size="", use_smb=False
+    ):
+        shared = YoutubeTrailerScraper(
+            config={
+                "TMDB_API_KEY": "test_api_key",
+                "TMDB_READ_ACCESS_TOKEN": "test_token",
+                "MOVIES_PATHS": movies,
+                "TVSHOWS_PATHS": tvshows,
+                "SCAN_SAMPLE_SIZE": sample_size,
+                "USE_SMB_MOUNT": use_smb,
+            }
+        )
+        _SHARED_SCRAPERS.append(shared)
+        return shared
+
+    return build
+
+
+@pytest.fixture(scope="session")
+def scraper(scraper_factory):
+    """The YoutubeTrailerScraper built from the default test settings.
+
+    Shared by the whole session: tests needing other settings override its
+    attributes with monkeypatch (e.g. movies_paths, scan_sample_size), which
+    restores them after the test.
+    """
+    return scraper_factory()
@@ -5,6 +5,7 @@
 import time
 
 import pytest
+from conftest import paths_literal
 
 from youtubetrailerscraper import YoutubeTrailerScraper
 
@@ -25,7 +26,7 @@ def temp_env_with_movies(tmp_path):
     env_content = f"""
 TMDB_API_KEY=test_key
 TMDB_READ_ACCESS_TOKEN=test_token
-MOVIES_PATHS=['{movies_dir}']
+MOVIES_PATHS={paths_literal(movies_dir)}
 TVSHOWS_PATHS=[]
 USE_SMB_MOUNT=false
 """.strip()
@@ -43,6 +44,9 @@ USE_SMB_MOUNT=false
     return env_file, movies_dir
 
 
+# clear_cache() wipes the on-disk cache shared by every xdist worker; keep the
+# tests that clear it or rely on cache hits on one worker so they cannot race
+@pytest.mark.xdist_group("cache")
 class TestCachePersistence:
     """Test cache persistence across YoutubeTrailerScraper instances."""
 
@@ -196,7 +200,7 @@ class TestCachePersistence:
             f"""
 TMDB_API_KEY=test_key
 TMDB_READ_ACCESS_TOKEN=test_token
-MOVIES_PATHS=['{movies_dir1}']
+MOVIES_PATHS={paths_literal(movies_dir1)}
 TVSHOWS_PATHS=[]
 USE_SMB_MOUNT=false
 """.strip()
@@ -207,7 +211,7 @@ USE_SMB_MOUNT=false
             f"""
 TMDB_API_KEY=test_key
 TMDB_READ_ACCESS_TOKEN=test_token
-MOVIES_PATHS=['{movies_dir2}']
+MOVIES_PATHS={paths_literal(movies_dir2)}
 TVSHOWS_PATHS=[]
 USE_SMB_MOUNT=false
 """.strip()
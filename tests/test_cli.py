@@ -8,6 +8,7 @@ import sys
 from pathlib import Path
 
 import pytest
+from conftest import paths_literal
 
 
 @pytest.fixture
@@ -36,8 +37,8 @@ def test_env_file(tmp_path):
 TMDB_API_KEY=test_key_12345
 TMDB_READ_ACCESS_TOKEN=test_token_67890
 TMDB_API_BASE_URL=https://api.themoviedb.org/3
-MOVIES_PATHS=["{movies_dir}/"]
-TVSHOWS_PATHS=["{tvshows_dir}/"]
+MOVIES_PATHS={paths_literal(movies_dir)}
+TVSHOWS_PATHS={paths_literal(tvshows_dir)}
 SMB_MOUNT_POINT=
 USE_SMB_MOUNT=false
 """
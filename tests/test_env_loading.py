@@ -3,164 +3,110 @@
 """Tests for environment variable loading in YoutubeTrailerScraper."""
 
 import os
-import tempfile
 from pathlib import Path
 
 import pytest
+from conftest import write_env  # pylint: disable=import-error
 
 from youtubetrailerscraper import YoutubeTrailerScraper  # pylint: disable=import-error
 
 
-def test_env_loading_with_valid_file():
+def test_env_loading_with_valid_file(tmp_path):
     """Test that environment variables are loaded correctly from .env file."""
     # Create a temporary .env file
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".env", delete=False) as f:
-        f.write("TMDB_API_KEY=test_api_key\n")
-        f.write("TMDB_READ_ACCESS_TOKEN=test_token\n")
-        f.write("TMDB_API_BASE_URL=https://api.themoviedb.org/3\n")
-        f.write('MOVIES_PATHS=["/path/to/movies/"]\n')
-        f.write('TVSHOWS_PATHS=["/path/to/tvshows/"]\n')
-        f.write("USE_SMB_MOUNT=false\n")  # Explicitly disable SMB mount
-        env_file = f.name
+    env_file = write_env(
+        tmp_path,
+        "TMDB_API_BASE_URL=https://api.themoviedb.org/3\n"
+        "USE_SMB_MOUNT=false\n",  # Explicitly disable SMB mount
+    )
 
-    try:
-        scraper = YoutubeTrailerScraper(env_file=env_file)
-
-        assert scraper.tmdb_api_key == "test_api_key"
-        assert scraper.tmdb_read_access_token == "test_token"
-        assert scraper.tmdb_api_base_url == "https://api.themoviedb.org/3"
-        assert len(scraper.movies_paths) == 1
-        assert scraper.movies_paths[0] == Path("/path/to/movies/")
-        assert len(scraper.tvshows_paths) == 1
-        assert scraper.tvshows_paths[0] == Path("/path/to/tvshows/")
-    finally:
-        os.unlink(env_file)
+    scraper = YoutubeTrailerScraper(env_file=env_file)
+
+    assert scraper.tmdb_api_key == "test_api_key"
+    assert scraper.tmdb_read_access_token == "test_token"
+    assert scraper.tmdb_api_base_url == "https://api.themoviedb.org/3"
+    assert len(scraper.movies_paths) == 1
+    assert scraper.movies_paths[0] == Path("/path/to/movies/")
+    assert len(scraper.tvshows_paths) == 1
+    assert scraper.tvshows_paths[0] == Path("/path/to/tvshows/")
 
 
-def test_env_loading_missing_required_variable():
+def test_env_loading_missing_required_variable(tmp_path):
     """Test that ValueError is raised when required variable is missing."""
     # Create a temporary .env file without TMDB_API_KEY
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".env", delete=False) as f:
-        f.write("TMDB_READ_ACCESS_TOKEN=test_token\n")
-        f.write('MOVIES_PATHS=["/path/to/movies/"]\n')
-        f.write('TVSHOWS_PATHS=["/path/to/tvshows/"]\n')
-        env_file = f.name
-
+    env_file = tmp_path / ".env"
+    env_file.write_text(
+        "TMDB_READ_ACCESS_TOKEN=test_token\n"
+        'MOVIES_PATHS=["/path/to/movies/"]\n'
+        'TVSHOWS_PATHS=["/path/to/tvshows/"]\n'
+    )
+
+    # Clear environment variable if it exists
+    old_value = os.environ.pop("TMDB_API_KEY", None)
     try:
-        # Clear environment variable if it exists
-        old_value = os.environ.pop("TMDB_API_KEY", None)
-        try:
-            with pytest.raises(ValueError, match="TMDB_API_KEY"):
-                YoutubeTrailerScraper(env_file=env_file)
-        finally:
-            # Restore old value
-            if old_value is not None:
-                os.environ["TMDB_API_KEY"] = old_value
+        with pytest.raises(ValueError, match="TMDB_API_KEY"):
+            YoutubeTrailerScraper(env_file=str(env_file))
     finally:
-        os.unlink(env_file)
+        # Restore old value
+        if old_value is not None:
+            os.environ["TMDB_API_KEY"] = old_value
 
 
-def test_env_loading_with_defaults():
+def test_env_loading_with_defaults(tmp_path):
     """Test that default values are used when optional variables are missing."""
     # Create a temporary .env file with only required variables
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".env", delete=False) as f:
-        f.write("TMDB_API_KEY=test_api_key\n")
-        f.write("TMDB_READ_ACCESS_TOKEN=test_token\n")
-        f.write('MOVIES_PATHS=["/path/to/movies/"]\n')
-        f.write('TVSHOWS_PATHS=["/path/to/tvshows/"]\n')
-        f.write("USE_SMB_MOUNT=false\n")  # Explicitly disable SMB mount
-        f.write("SMB_MOUNT_POINT=\n")  # Explicitly set empty SMB mount point
-        env_file = f.name
+    env_file = write_env(
+        tmp_path,
+        "USE_SMB_MOUNT=false\n"  # Explicitly disable SMB mount
+        "SMB_MOUNT_POINT=\n",  # Explicitly set empty SMB mount point
+    )
 
-    try:
-        scraper = YoutubeTrailerScraper(env_file=env_file)
+    scraper = YoutubeTrailerScraper(env_file=env_file)
 
-        # Check defaults
-        assert scraper.tmdb_api_base_url == "https://api.themoviedb.org/3"
-        assert scraper.youtube_search_url == "https://www.youtube.com/results?search_query={query}"
-        assert scraper.default_search_query_format == "{title} {year} bande annonce"
-        assert scraper.smb_mount_point == ""
-    finally:
-        os.unlink(env_file)
+    # Check defaults
+    assert scraper.tmdb_api_base_url == "https://api.themoviedb.org/3"
+    assert scraper.youtube_search_url == "https://www.youtube.com/results?search_query={query}"
+    assert scraper.default_search_query_format == "{title} {year} bande annonce"
+    assert scraper.smb_mount_point == ""
 
 
-def test_env_loading_invalid_path_list():
+def test_env_loading_invalid_path_list(tmp_path):
     """Test that ValueError is raised for invalid path list format."""
     # Create a temporary .env file with invalid path list
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".env", delete=False) as f:
-        f.write("TMDB_API_KEY=test_api_key\n")
-        f.write("TMDB_READ_ACCESS_TOKEN=test_token\n")
-        f.write("MOVIES_PATHS=not_a_list\n")
-        f.write('TVSHOWS_PATHS=["/path/to/tvshows/"]\n')
-        env_file = f.name
+    env_file = write_env(tmp_path, movies="not_a_list")
 
-    try:
-        with pytest.raises(ValueError, match="Invalid path list format"):
-            YoutubeTrailerScraper(env_file=env_file)
-    finally:
-        os.unlink(env_file)
+    with pytest.raises(ValueError, match="Invalid path list format"):
+        YoutubeTrailerScraper(env_file=env_file)
 
 
-def test_env_loading_path_list_not_list_type():
+def test_env_loading_path_list_not_list_type(tmp_path):
     """Test that ValueError is raised when path list evaluates to non-list type."""
     # Create a temporary .env file with a dict instead of list
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".env", delete=False) as f:
-        f.write("TMDB_API_KEY=test_api_key\n")
-        f.write("TMDB_READ_ACCESS_TOKEN=test_token\n")
-        f.write('MOVIES_PATHS={"path": "/movies/"}\n')  # Dict instead of list
-        f.write('TVSHOWS_PATHS=["/path/to/tvshows/"]\n')
-        env_file = f.name
+    env_file = write_env(tmp_path, movies='{"path": "/movies/"}')  # Dict instead of list
 
-    try:
-        with pytest.raises(ValueError, match="PATHS must be a Python list"):
-            YoutubeTrailerScraper(env_file=env_file)
-    finally:
-        os.unlink(env_file)
+    with pytest.raises(ValueError, match="PATHS must be a Python list"):
+        YoutubeTrailerScraper(env_file=env_file)
 
 
-def test_env_loading_string_list_syntax_error():
+def test_env_loading_string_list_syntax_error(tmp_path):
     """Test that ValueError is raised when string list has syntax error."""
     # Create a temporary .env file with invalid Python syntax
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".env", delete=False) as f:
-        f.write("TMDB_API_KEY=test_api_key\n")
-        f.write("TMDB_READ_ACCESS_TOKEN=test_token\n")
-        f.write('MOVIES_PATHS=["/path/to/movies/"]\n')
-        f.write('TVSHOWS_PATHS=["/path/to/tvshows/"]\n')
-        f.write("TMDB_LANGUAGES=['en-US',]\n")  # Trailing comma is OK, but use malformed one
-        f.write = lambda _: None  # This won't work, but let's try unbalanced brackets
-        env_file = f.name
+    env_file = write_env(
+        tmp_path,
+        "TMDB_LANGUAGES=['en-US'\n",  # Unbalanced brackets - syntax error
+    )
 
-    try:
-        # Actually write invalid syntax manually
-        with open(env_file, "w", encoding="utf-8") as f:
-            f.write("TMDB_API_KEY=test_api_key\n")
-            f.write("TMDB_READ_ACCESS_TOKEN=test_token\n")
-            f.write('MOVIES_PATHS=["/path/to/movies/"]\n')
-            f.write('TVSHOWS_PATHS=["/path/to/tvshows/"]\n')
-            f.write("TMDB_LANGUAGES=['en-US'\n")  # Unbalanced brackets - syntax error
-
-        with pytest.raises(ValueError, match="Invalid list format"):
-            YoutubeTrailerScraper(env_file=env_file)
-    finally:
-        os.unlink(env_file)
+    with pytest.raises(ValueError, match="Invalid list format"):
+        YoutubeTrailerScraper(env_file=env_file)
 
 
-def test_env_loading_string_list_not_list():
+def test_env_loading_string_list_not_list(tmp_path):
     """Test that ValueError is raised when string list is not a list type."""
     # Create a temporary .env file with a number instead of list for TMDB_LANGUAGES
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".env", delete=False) as f:
-        f.write("TMDB_API_KEY=test_api_key\n")
-        f.write("TMDB_READ_ACCESS_TOKEN=test_token\n")
-        f.write('MOVIES_PATHS=["/path/to/movies/"]\n')
-        f.write('TVSHOWS_PATHS=["/path/to/tvshows/"]\n')
-        f.write("TMDB_LANGUAGES=123\n")  # Number instead of list
-        env_file = f.name
+    env_file = write_env(tmp_path, "TMDB_LANGUAGES=123\n")  # Number instead of list
 
-    try:
-        with pytest.raises(ValueError, match="Value must be a Python list"):
-            YoutubeTrailerScraper(env_file=env_file)
-    finally:
-        os.unlink(env_file)
+    with pytest.raises(ValueError, match="Value must be a Python list"):
+        YoutubeTrailerScraper(env_file=env_file)
 
 
 def test_env_loading_missing_file():
@@ -169,136 +115,170 @@ def test_env_loading_missing_file():
         YoutubeTrailerScraper(env_file="nonexistent.env")
 
 
-def test_smb_mount_with_env_variable():
+def test_smb_mount_with_env_variable(tmp_path):
     """Test that SMB mount point is prepended when USE_SMB_MOUNT=true in env."""
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".env", delete=False) as f:
-        f.write("TMDB_API_KEY=test_api_key\n")
-        f.write("TMDB_READ_ACCESS_TOKEN=test_token\n")
-        f.write('MOVIES_PATHS=["/Volumes/Disk1/medias/films/", "/Volumes/Disk2/medias/films/"]\n')
-        f.write('TVSHOWS_PATHS=["/Volumes/Disk1/medias/tvshows/"]\n')
-        f.write('TMDB_LANGUAGES=["en-US"]\n')
-        f.write("SMB_MOUNT_POINT=/Volumes/MediaServer\n")
-        f.write("USE_SMB_MOUNT=true\n")
-        env_file = f.name
-
-    try:
-        scraper = YoutubeTrailerScraper(env_file=env_file)
-
-        assert scraper.use_smb_mount is True
-        assert scraper.smb_mount_point == "/Volumes/MediaServer"
-        assert len(scraper.movies_paths) == 2
-        # SMB mount point is prepended to paths as Path objects
-        assert scraper.movies_paths[0] == Path("/Volumes/MediaServer/Volumes/Disk1/medias/films")
-        assert scraper.movies_paths[1] == Path("/Volumes/MediaServer/Volumes/Disk2/medias/films")
-        assert scraper.tvshows_paths[0] == Path(
-            "/Volumes/MediaServer/Volumes/Disk1/medias/tvshows"
-        )
-    finally:
-        os.unlink(env_file)
-
-
-def test_smb_mount_with_constructor_flag():
+    env_file = write_env(
+        tmp_path,
+        'TMDB_LANGUAGES=["en-US"]\n'
+        "SMB_MOUNT_POINT=/Volumes/MediaServer\n"
+        "USE_SMB_MOUNT=true\n",
+        movies='["/Volumes/Disk1/medias/films/", "/Volumes/Disk2/medias/films/"]',
+        tvshows='["/Volumes/Disk1/medias/tvshows/"]',
+    )
+
+    scraper = YoutubeTrailerScraper(env_file=env_file)
+
+    assert scraper.use_smb_mount is True
+    assert scraper.smb_mount_point == "/Volumes/MediaServer"
+    assert len(scraper.movies_paths) == 2
+    # SMB mount point is prepended to paths as Path objects
+    assert scraper.movies_paths[0] == Path("/Volumes/MediaServer/Volumes/Disk1/medias/films")
+    assert scraper.movies_paths[1] == Path("/Volumes/MediaServer/Volumes/Disk2/medias/films")
+    assert scraper.tvshows_paths[0] == Path("/Volumes/MediaServer/Volumes/Disk1/medias/tvshows")
+
+
+def test_smb_mount_with_constructor_flag(tmp_path):
     """Test that SMB mount point is prepended when use_smb=True in constructor."""
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".env", delete=False) as f:
-        f.write("TMDB_API_KEY=test_api_key\n")
-        f.write("TMDB_READ_ACCESS_TOKEN=test_token\n")
-        f.write('MOVIES_PATHS=["/Volumes/Disk1/medias/films/"]\n')
-        f.write('TVSHOWS_PATHS=["/Volumes/Disk1/medias/tvshows/"]\n')
-        f.write('TMDB_LANGUAGES=["en-US"]\n')
-        f.write("SMB_MOUNT_POINT=/Volumes/MediaServer\n")
-        env_file = f.name
+    env_file = write_env(
+        tmp_path,
+        'TMDB_LANGUAGES=["en-US"]\n'
+        "SMB_MOUNT_POINT=/Volumes/MediaServer\n",
+        movies='["/Volumes/Disk1/medias/films/"]',
+        tvshows='["/Volumes/Disk1/medias/tvshows/"]',
+    )
 
-    try:
-        scraper = YoutubeTrailerScraper(env_file=env_file, use_smb=True)
+    scraper = YoutubeTrailerScraper(env_file=env_file, use_smb=True)
 
-        assert scraper.use_smb_mount is True
-        # SMB mount point is prepended to paths as Path objects
-        assert scraper.movies_paths[0] == Path("/Volumes/MediaServer/Volumes/Disk1/medias/films")
-        assert scraper.tvshows_paths[0] == Path(
-            "/Volumes/MediaServer/Volumes/Disk1/medias/tvshows"
-        )
-    finally:
-        os.unlink(env_file)
+    assert scraper.use_smb_mount is True
+    # SMB mount point is prepended to paths as Path objects
+    assert scraper.movies_paths[0] == Path("/Volumes/MediaServer/Volumes/Disk1/medias/films")
+    assert scraper.tvshows_paths[0] == Path("/Volumes/MediaServer/Volumes/Disk1/medias/tvshows")
 
 
-def test_smb_mount_disabled():
+def test_smb_mount_disabled(tmp_path):
     """Test that SMB mount point is NOT prepended when USE_SMB_MOUNT=false."""
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".env", delete=False) as f:
-        f.write("TMDB_API_KEY=test_api_key\n")
-        f.write("TMDB_READ_ACCESS_TOKEN=test_token\n")
-        f.write('MOVIES_PATHS=["/Volumes/Disk1/medias/films/"]\n')
-        f.write('TVSHOWS_PATHS=["/Volumes/Disk1/medias/tvshows/"]\n')
-        f.write('TMDB_LANGUAGES=["en-US"]\n')
-        f.write("SMB_MOUNT_POINT=/Volumes/MediaServer\n")
-        f.write("USE_SMB_MOUNT=false\n")
-        env_file = f.name
+    env_file = write_env(
+        tmp_path,
+        'TMDB_LANGUAGES=["en-US"]\n'
+        "SMB_MOUNT_POINT=/Volumes/MediaServer\n"
+        "USE_SMB_MOUNT=false\n",
+        movies='["/Volumes/Disk1/medias/films/"]',
+        tvshows='["/Volumes/Disk1/medias/tvshows/"]',
+    )
 
-    try:
-        scraper = YoutubeTrailerScraper(env_file=env_file)
+    scraper = YoutubeTrailerScraper(env_file=env_file)
 
-        assert scraper.use_smb_mount is False
-        # Paths are not prefixed when SMB mount is disabled
-        assert scraper.movies_paths[0] == Path("/Volumes/Disk1/medias/films/")
-        assert scraper.tvshows_paths[0] == Path("/Volumes/Disk1/medias/tvshows/")
-    finally:
-        os.unlink(env_file)
+    assert scraper.use_smb_mount is False
+    # Paths are not prefixed when SMB mount is disabled
+    assert scraper.movies_paths[0] == Path("/Volumes/Disk1/medias/films/")
+    assert scraper.tvshows_paths[0] == Path("/Volumes/Disk1/medias/tvshows/")
 
 
-def test_smb_mount_env_overrides_constructor():
+def test_smb_mount_env_overrides_constructor(tmp_path):
     """Test that USE_SMB_MOUNT env variable overrides constructor parameter."""
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".env", delete=False) as f:
-        f.write("TMDB_API_KEY=test_api_key\n")
-        f.write("TMDB_READ_ACCESS_TOKEN=test_token\n")
-        f.write('MOVIES_PATHS=["/Volumes/Disk1/medias/films/"]\n')
-        f.write('TVSHOWS_PATHS=["/Volumes/Disk1/medias/tvshows/"]\n')
-        f.write('TMDB_LANGUAGES=["en-US"]\n')
-        f.write("SMB_MOUNT_POINT=/Volumes/MediaServer\n")
-        f.write("USE_SMB_MOUNT=true\n")
-        env_file = f.name
+    env_file = write_env(
+        tmp_path,
+        'TMDB_LANGUAGES=["en-US"]\n'
+        "SMB_MOUNT_POINT=/Volumes/MediaServer\n"
+        "USE_SMB_MOUNT=true\n",
+        movies='["/Volumes/Disk1/medias/films/"]',
+        tvshows='["/Volumes/Disk1/medias/tvshows/"]',
+    )
 
-    try:
-        # Pass use_smb=False, but env has USE_SMB_MOUNT=true
-        scraper = YoutubeTrailerScraper(env_file=env_file, use_smb=False)
+    # Pass use_smb=False, but env has USE_SMB_MOUNT=true
+    scraper = YoutubeTrailerScraper(env_file=env_file, use_smb=False)
 
-        # Environment variable should override constructor parameter
-        assert scraper.use_smb_mount is True
-        # SMB mount point is prepended to paths as Path objects
-        assert scraper.movies_paths[0] == Path("/Volumes/MediaServer/Volumes/Disk1/medias/films")
-    finally:
-        os.unlink(env_file)
+    # Environment variable should override constructor parameter
+    assert scraper.use_smb_mount is True
+    # SMB mount point is prepended to paths as Path objects
+    assert scraper.movies_paths[0] == Path("/Volumes/MediaServer/Volumes/Disk1/medias/films")
 
 
-def test_scan_sample_size_valid():
+def test_scan_sample_size_valid(tmp_path):
     """Test that SCAN_SAMPLE_SIZE is loaded correctly."""
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".env", delete=False) as f:
-        f.write("TMDB_API_KEY=test_api_key\n")
-        f.write("TMDB_READ_ACCESS_TOKEN=test_token\n")
-        f.write('MOVIES_PATHS=["/path/to/movies/"]\n')
-        f.write('TVSHOWS_PATHS=["/path/to/tvshows/"]\n')
-        f.write('TMDB_LANGUAGES=["en-US"]\n')
-        f.write("SCAN_SAMPLE_SIZE=100\n")
-        env_file = f.name
+    env_file = write_env(
+        tmp_path,
+        'TMDB_LANGUAGES=["en-US"]\n'
+        "SCAN_SAMPLE_SIZE=100\n",
+    )
 
-    try:
-        scraper = YoutubeTrailerScraper(env_file=env_file)
-        assert scraper.scan_sample_size == 100
-    finally:
-        os.unlink(env_file)
+    scraper = YoutubeTrailerScraper(env_file=env_file)
+    assert scraper.scan_sample_size == 100
 
 
-def test_scan_sample_size_invalid():
+def test_scan_sample_size_invalid(tmp_path):
     """Test that invalid SCAN_SAMPLE_SIZE is ignored."""
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".env", delete=False) as f:
-        f.write("TMDB_API_KEY=test_api_key\n")
-        f.write("TMDB_READ_ACCESS_TOKEN=test_token\n")
-        f.write('MOVIES_PATHS=["/path/to/movies/"]\n')
-        f.write('TVSHOWS_PATHS=["/path/to/tvshows/"]\n')
-        f.write('TMDB_LANGUAGES=["en-US"]\n')
-        f.write("SCAN_SAMPLE_SIZE=not_a_number\n")
-        env_file = f.name
-
-    try:
-        scraper = YoutubeTrailerScraper(env_file=env_file)
-        assert scraper.scan_sample_size is None
-    finally:
-        os.unlink(env_file)
+    env_file = write_env(
+        tmp_path,
+        'TMDB_LANGUAGES=["en-US"]\n'
+        "SCAN_SAMPLE_SIZE=not_a_number\n",
+    )
+
+    scraper = YoutubeTrailerScraper(env_file=env_file)
+    assert scraper.scan_sample_size is None
+
+
+def test_config_mapping_replaces_env_file():
+    """Test that a config mapping is used without any .env file."""
+    scraper = YoutubeTrailerScraper(
+        config={
+            "TMDB_API_KEY": "test_api_key",
+            "TMDB_READ_ACCESS_TOKEN": "test_token",
+            "MOVIES_PATHS": [Path("/path/to/movies/")],
+            "TVSHOWS_PATHS": '["/path/to/tvshows/"]',  # .env-style strings work too
+            "SCAN_SAMPLE_SIZE": 10,
+            "USE_SMB_MOUNT": False,
+        }
+    )
+
+    assert scraper.tmdb_api_key == "test_api_key"
+    assert scraper.movies_paths == [Path("/path/to/movies/")]
+    assert scraper.tvshows_paths == [Path("/path/to/tvshows/")]
+    assert scraper.scan_sample_size == 10
+    assert scraper.use_smb_mount is False
+    assert scraper.tmdb_languages == ["en-US"]  # Defaults still apply
+
+
+def test_config_mapping_ignores_process_environment(monkeypatch):
+    """Test that settings missing from the config mapping never come from os.environ."""
+    monkeypatch.setenv("SCAN_SAMPLE_SIZE", "100")
+    monkeypatch.setenv("TMDB_API_KEY", "from_environment")
+
+    with pytest.raises(ValueError, match="TMDB_API_KEY"):
+        YoutubeTrailerScraper(config={"MOVIES_PATHS": [], "TVSHOWS_PATHS": []})
+
+    scraper = YoutubeTrailerScraper(
+        config={
+            "TMDB_API_KEY": "test_api_key",
+            "TMDB_READ_ACCESS_TOKEN": "test_token",
+            "MOVIES_PATHS": [],
+            "TVSHOWS_PATHS": [],
+        }
+    )
+    assert scraper.scan_sample_size is None
+
+
+def test_config_mapping_none_values_fall_back_to_defaults():
+    """Test that None values in a config mapping are treated as unset."""
+    scraper = YoutubeTrailerScraper(
+        config={
+            "TMDB_API_KEY": "test_api_key",
+            "TMDB_READ_ACCESS_TOKEN": "test_token",
+            "MOVIES_PATHS": [],
+            "TVSHOWS_PATHS": [],
+            "SCAN_SAMPLE_SIZE": None,
+            "YOUTUBE_COOKIES_FILE": None,
+        }
+    )
+    assert scraper.scan_sample_size is None
+    assert scraper.youtube_cookies_file == ""
+
+    with pytest.raises(ValueError, match="TMDB_READ_ACCESS_TOKEN"):
+        YoutubeTrailerScraper(
+            config={
+                "TMDB_API_KEY": "test_api_key",
+                "TMDB_READ_ACCESS_TOKEN": None,
+                "MOVIES_PATHS": [],
+                "TVSHOWS_PATHS": [],
+            }
+        )
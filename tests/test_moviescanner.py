@@ -2,14 +2,20 @@
 # -*- coding: utf-8 -*-
 """Unit tests for MovieScanner class."""
 
-from pathlib import Path  # pylint: disable=unused-import
-from unittest.mock import patch
-
 import pytest
 
 from youtubetrailerscraper.moviescanner import MovieScanner  # pylint: disable=import-error
 
 
+def _raises(exc):
+    """Build a stand-in for os.scandir that always raises exc."""
+
+    def raiser(*args, **kwargs):
+        raise exc
+
+    return raiser
+
+
 @pytest.fixture
 def temp_movie_structure(tmp_path):
     """Create a temporary movie directory structure for testing.
@@ -300,6 +306,30 @@ class TestMovieScannerFindMissingTrailers:
         assert len(missing) == 0  # All have trailers despite no dash
 
 
+class TestMovieScannerIterMissingTrailers:
+    """Test MovieScanner.iter_missing_trailers() method."""
+
+    def test_iter_missing_trailers_streams_results(
+        self, temp_movie_structure
+    ):  # pylint: disable=redefined-outer-name
+        """Test results are yielded lazily and match find_missing_trailers."""
+        scanner = MovieScanner()
+        stream = scanner.iter_missing_trailers([temp_movie_structure])
+
+        assert not isinstance(stream, list)
+        first = next(stream)
+        rest = list(stream)
+        assert {first, *rest} == set(
+            scanner.find_missing_trailers.__wrapped__(scanner, [temp_movie_structure])
+        )
+
+    def test_iter_missing_trailers_empty_paths_raises_eagerly(self):
+        """Test empty paths raise ValueError before iteration starts."""
+        scanner = MovieScanner()
+        with pytest.raises(ValueError, match="Paths list cannot be empty"):
+            scanner.iter_missing_trailers([])
+
+
 class TestMovieScannerHasTrailer:
     """Test MovieScanner.has_trailer() method."""
 
@@ -372,12 +402,12 @@ class TestMovieScannerHasTrailer:
 
         assert scanner.has_trailer(movie_dir) is True
 
-    def test_has_trailer_handles_permission_error(self, tmp_path):
+    def test_has_trailer_handles_permission_error(self, tmp_path, monkeypatch):
         """Test has_trailer handles permission errors gracefully."""
         scanner = MovieScanner()
         movie_dir = tmp_path / "Movie"
         movie_dir.mkdir()
 
-        # Mock iterdir to raise PermissionError using Path class
-        with patch("pathlib.Path.iterdir", side_effect=PermissionError("Access denied")):
-            assert scanner.has_trailer(movie_dir) is False
+        # Make os.scandir raise PermissionError
+        monkeypatch.setattr("os.scandir", _raises(PermissionError("Access denied")))
+        assert scanner.has_trailer(movie_dir) is False
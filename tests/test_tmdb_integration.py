@@ -4,36 +4,9 @@
 # pylint: disable=redefined-outer-name
 # pylint: disable=duplicate-code
 
-import os
-import tempfile
 from pathlib import Path
 
-import pytest
-
-from youtubetrailerscraper import YoutubeTrailerScraper
-
-
-@pytest.fixture
-def env_file():
-    """Create a temporary .env file for testing."""
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".env", delete=False) as f:
-        f.write("TMDB_API_KEY=test_api_key\n")
-        f.write("TMDB_READ_ACCESS_TOKEN=test_token\n")
-        f.write('MOVIES_PATHS=["/path/to/movies/"]\n')
-        f.write('TVSHOWS_PATHS=["/path/to/tvshows/"]\n')
-        f.write('TMDB_LANGUAGES=["en-US"]\n')
-        env_file_path = f.name
-
-    yield env_file_path
-
-    # Cleanup
-    os.unlink(env_file_path)
-
-
-@pytest.fixture
-def scraper(env_file):
-    """Create a YoutubeTrailerScraper instance for testing."""
-    return YoutubeTrailerScraper(env_file=env_file)
+from conftest import paths_literal
 
 
 class TestMetadataExtraction:  # pylint: disable=protected-access
@@ -260,93 +233,65 @@ class TestOrchestration:
 class TestIntegrationWorkflow:
     """Test end-to-end workflow integration."""
 
-    def test_full_workflow_scan_and_search_movies(self, tmp_path, mocker):
+    def test_full_workflow_scan_and_search_movies(self, scraper_factory, tmp_path, mocker):
         """Test full workflow: scan for movies, then search TMDB."""
         # Create test movies without trailers
         movie1 = tmp_path / "Inception (2010)"
         movie1.mkdir()
-        (movie1 / "movie.mp4").write_text("fake video")
+        (movie1 / "movie.mp4").touch()
 
         movie2 = tmp_path / "The Matrix (1999)"
         movie2.mkdir()
-        (movie2 / "movie.mp4").write_text("fake video")
-
-        # Create .env file
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".env", delete=False) as f:
-            f.write("TMDB_API_KEY=test_api_key\n")
-            f.write("TMDB_READ_ACCESS_TOKEN=test_token\n")
-            f.write(f'MOVIES_PATHS=["{str(tmp_path)}/"]\n')
-            f.write('TVSHOWS_PATHS=["/path/to/tvshows/"]\n')
-            f.write("USE_SMB_MOUNT=false\n")
-            env_file = f.name
-
-        try:
-            scraper = YoutubeTrailerScraper(env_file=env_file)
-
-            # Mock TMDB search
-            mocker.patch.object(
-                scraper.tmdb_search_engine,
-                "search_movie",
-                return_value=["https://www.youtube.com/watch?v=test"],
-            )
-
-            # Step 1: Scan for movies without trailers
-            movies_without_trailers = scraper.scan_for_movies_without_trailers()
-            assert len(movies_without_trailers) == 2
-
-            # Step 2: Search TMDB for trailers
-            results = scraper.search_trailers_for_movies(movies_without_trailers)
-
-            # Verify results
-            assert len(results) == 2
-            for movie_path in movies_without_trailers:
-                assert movie_path in results
-                assert results[movie_path] == ["https://www.youtube.com/watch?v=test"]
-
-        finally:
-            os.unlink(env_file)
-
-    def test_workflow_with_mixed_results(self, tmp_path, mocker):
+        (movie2 / "movie.mp4").touch()
+
+        scraper = scraper_factory(movies=paths_literal(tmp_path))
+
+        # Mock TMDB search
+        mocker.patch.object(
+            scraper.tmdb_search_engine,
+            "search_movie",
+            return_value=["https://www.youtube.com/watch?v=test"],
+        )
+
+        # Step 1: Scan for movies without trailers
+        movies_without_trailers = scraper.scan_for_movies_without_trailers()
+        assert len(movies_without_trailers) == 2
+
+        # Step 2: Search TMDB for trailers
+        results = scraper.search_trailers_for_movies(movies_without_trailers)
+
+        # Verify results
+        assert len(results) == 2
+        for movie_path in movies_without_trailers:
+            assert movie_path in results
+            assert results[movie_path] == ["https://www.youtube.com/watch?v=test"]
+
+    def test_workflow_with_mixed_results(self, scraper_factory, tmp_path, mocker):
         """Test workflow where some movies have trailers on TMDB and some don't."""
         # Create test movies
         movie1 = tmp_path / "Found Movie (2020)"
         movie1.mkdir()
-        (movie1 / "movie.mp4").write_text("fake video")
+        (movie1 / "movie.mp4").touch()
 
         movie2 = tmp_path / "Not Found Movie (2020)"
         movie2.mkdir()
-        (movie2 / "movie.mp4").write_text("fake video")
-
-        # Create .env file
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".env", delete=False) as f:
-            f.write("TMDB_API_KEY=test_api_key\n")
-            f.write("TMDB_READ_ACCESS_TOKEN=test_token\n")
-            f.write(f'MOVIES_PATHS=["{str(tmp_path)}/"]\n')
-            f.write('TVSHOWS_PATHS=["/path/to/tvshows/"]\n')
-            f.write("USE_SMB_MOUNT=false\n")
-            env_file = f.name
-
-        try:
-            scraper = YoutubeTrailerScraper(env_file=env_file)
-
-            # Mock TMDB search with mixed results
-            def mock_search(title, year):  # pylint: disable=unused-argument
-                if title == "Found Movie":
-                    return ["https://www.youtube.com/watch?v=found"]
-                return []
-
-            mocker.patch.object(
-                scraper.tmdb_search_engine, "search_movie", side_effect=mock_search
-            )
-
-            # Scan and search
-            movies_without_trailers = scraper.scan_for_movies_without_trailers()
-            results = scraper.search_trailers_for_movies(movies_without_trailers)
-
-            # Verify mixed results
-            assert len(results) == 2
-            assert len(results[movie1]) == 1  # Found on TMDB
-            assert len(results[movie2]) == 0  # Not found on TMDB
-
-        finally:
-            os.unlink(env_file)
+        (movie2 / "movie.mp4").touch()
+
+        scraper = scraper_factory(movies=paths_literal(tmp_path))
+
+        # Mock TMDB search with mixed results
+        def mock_search(title, year):  # pylint: disable=unused-argument
+            if title == "Found Movie":
+                return ["https://www.youtube.com/watch?v=found"]
+            return []
+
+        mocker.patch.object(scraper.tmdb_search_engine, "search_movie", side_effect=mock_search)
+
+        # Scan and search
+        movies_without_trailers = scraper.scan_for_movies_without_trailers()
+        results = scraper.search_trailers_for_movies(movies_without_trailers)
+
+        # Verify mixed results
+        assert len(results) == 2
+        assert len(results[movie1]) == 1  # Found on TMDB
+        assert len(results[movie2]) == 0  # Not found on TMDB
@@ -3,6 +3,9 @@
 """Unit tests for TMDBSearchEngine class."""
 # pylint: disable=protected-access  # Testing protected methods is legitimate
 
+import asyncio
+import threading
+import time
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -38,6 +41,8 @@ class TestTMDBSearchEngineInit:
         assert engine.timeout == 10
         assert engine.max_retries == 3
         assert engine.retry_delay == 1.0
+        assert engine.cache_ttl == 86400
+        assert engine.max_backoff == 30.0
 
     def test_init_with_custom_parameters(self):
         """Test initialization with custom parameters."""
@@ -69,6 +74,77 @@ class TestTMDBSearchEngineInit:
         with pytest.raises(ValueError, match="TMDB API key cannot be empty"):
             TMDBSearchEngine(api_key=None)
 
+    def test_init_mounts_pooled_https_adapter(self):
+        """Test that a pooled HTTPS adapter is mounted on the engine session."""
+        engine = TMDBSearchEngine(api_key="test_key")
+        adapter = engine._session.get_adapter("https://api.themoviedb.org/3")
+        assert isinstance(adapter, requests.adapters.HTTPAdapter)
+
+    def test_session_adapter_retry_policy(self):
+        """Test the mounted adapter retries transient failures with backoff."""
+        engine = TMDBSearchEngine(api_key="test_key", max_retries=4, retry_delay=0.5)
+        retry = engine._session.get_adapter("https://api.themoviedb.org/3").max_retries
+
+        assert retry.total == 3  # 4 attempts in total
+        assert retry.backoff_factor == 0.5
+        assert retry.backoff_max == 30.0
+        assert set(retry.status_forcelist) == {429, 500, 502, 503, 504}
+        assert retry.allowed_methods == frozenset(["GET"])
+        assert retry.respect_retry_after_header is True
+        assert retry.raise_on_status is False
+
+    def test_session_retry_backoff_is_jittered(self):
+        """Test each retry delay is scaled by a random factor and stays capped."""
+        engine = TMDBSearchEngine(api_key="test_key", max_backoff=30.0)
+        retry = engine._session.get_adapter("https://api.themoviedb.org/3").max_retries
+
+        with patch("urllib3.util.retry.Retry.get_backoff_time", side_effect=[4.0, 4.0, 25.0]):
+            with patch("random.uniform", side_effect=[0.5, 1.25, 1.4]) as mock_uniform:
+                delays = [retry.get_backoff_time() for _ in range(3)]
+
+        assert delays == [2.0, 5.0, 30.0]  # 25 * 1.4 is capped at max_backoff
+        mock_uniform.assert_called_with(0.5, 1.5)
+
+    def test_engines_share_one_session(self):
+        """Test that engines with the same retry policy reuse one shared session."""
+        first = TMDBSearchEngine(api_key="test_key")
+        second = TMDBSearchEngine(api_key="other_key")
+        assert first._session is second._session is TMDBSearchEngine.get_shared_session()
+
+    def test_engines_with_different_retry_policies_get_separate_sessions(self):
+        """Test that a different retry policy gets its own shared session."""
+        default = TMDBSearchEngine(api_key="test_key")
+        patient = TMDBSearchEngine(api_key="test_key", max_retries=5)
+        assert default._session is not patient._session
+        assert patient._session is TMDBSearchEngine.get_shared_session(max_retries=5)
+
+    def test_init_does_not_create_session(self):
+        """Test that the HTTP session is only created on first use."""
+        TMDBSearchEngine.close_shared_session()
+        engine = TMDBSearchEngine(api_key="test_key")
+        assert not TMDBSearchEngine._shared_sessions
+
+        assert engine._session is TMDBSearchEngine.get_shared_session()
+
+    def test_init_with_custom_session(self):
+        """Test that a caller-provided session is used for API calls."""
+        session = MagicMock()
+        session.get.return_value.content = b'{"results": []}'
+        engine = TMDBSearchEngine(api_key="test_key", session=session)
+
+        assert engine._make_request("/search/movie", {"query": "Inception"}) == {"results": []}
+        session.get.assert_called_once()
+        assert engine._session is not TMDBSearchEngine.get_shared_session()
+
+    def test_close_shared_session_resets_it(self):
+        """Test close_shared_session() closes sessions and new ones are created."""
+        session = TMDBSearchEngine.get_shared_session()
+        with patch.object(session, "close") as mock_close:
+            TMDBSearchEngine.close_shared_session()
+            mock_close.assert_called_once()
+
+        assert TMDBSearchEngine.get_shared_session() is not session
+
 
 class TestTMDBSearchEngineNormalizeTitle:
     """Test TMDBSearchEngine._normalize_title method."""
@@ -118,9 +194,9 @@ class TestTMDBSearchEngineMakeRequest:
         """Test successful API request."""
         engine = TMDBSearchEngine(api_key="test_key")
         mock_response = MagicMock()
-        mock_response.json.return_value = {"results": [{"id": 123}]}
+        mock_response.content = b'{"results": [{"id": 123}]}'
 
-        with patch("requests.get", return_value=mock_response) as mock_get:
+        with patch.object(engine._session, "get", return_value=mock_response) as mock_get:
             result = engine._make_request("/search/movie", {"query": "Inception"})
 
             assert result == {"results": [{"id": 123}]}
@@ -130,34 +206,71 @@ class TestTMDBSearchEngineMakeRequest:
             assert call_args.kwargs["params"]["query"] == "Inception"
             assert call_args.kwargs["timeout"] == 10
 
-    def test_make_request_with_retry_success(self):
-        """Test API request that succeeds after retry."""
-        engine = TMDBSearchEngine(api_key="test_key", retry_delay=0.01)
+    def test_make_request_cache_hit_skips_http(self):
+        """Test identical requests are answered from the response cache."""
+        engine = TMDBSearchEngine(api_key="test_key")
         mock_response = MagicMock()
-        mock_response.json.return_value = {"results": []}
+        mock_response.content = b'{"results": [{"id": 123}]}'
 
-        with patch("requests.get") as mock_get:
-            # First call fails, second succeeds
-            mock_get.side_effect = [
-                requests.exceptions.Timeout("Timeout"),
-                mock_response,
-            ]
+        with patch.object(engine._session, "get", return_value=mock_response) as mock_get:
+            first = engine._make_request("/search/movie", {"query": "Inception", "year": 2010})
+            second = engine._make_request("/search/movie", {"year": 2010, "query": "Inception"})
+
+        assert first == second == {"results": [{"id": 123}]}
+        assert mock_get.call_count == 1
 
-            result = engine._make_request("/search/movie")
-            assert result == {"results": []}
-            assert mock_get.call_count == 2
+    def test_make_request_expired_cache_entry_refetches(self):
+        """Test expired cache entries trigger a new HTTP request."""
+        cache = {}
+        engine = TMDBSearchEngine(api_key="test_key", cache=cache, cache_ttl=-1)
+        mock_response = MagicMock()
+        mock_response.content = b'{"results": []}'
 
-    def test_make_request_all_retries_fail(self):
-        """Test API request that fails after all retries."""
-        engine = TMDBSearchEngine(api_key="test_key", max_retries=2, retry_delay=0.01)
+        with patch.object(engine._session, "get", return_value=mock_response) as mock_get:
+            engine._make_request("/search/movie", {"query": "Inception"})
+            engine._make_request("/search/movie", {"query": "Inception"})
+
+        assert mock_get.call_count == 2
+        assert len(cache) == 1
+
+    def test_make_request_default_cache_evicts_oldest(self):
+        """Test the default response cache keeps at most response_cache_size entries."""
+        engine = TMDBSearchEngine(api_key="test_key", response_cache_size=2)
+        mock_response = MagicMock()
+        mock_response.content = b'{"results": []}'
+
+        with patch.object(engine._session, "get", return_value=mock_response):
+            for title in ("A", "B", "C"):
+                engine._make_request("/search/movie", {"query": title})
+
+        assert [key[1] for key in engine._cache] == [(("query", "B"),), (("query", "C"),)]
+
+    def test_make_request_default_cache_purges_expired(self, monkeypatch):
+        """Test expired responses are dropped from the default cache on insert."""
+        engine = TMDBSearchEngine(api_key="test_key", cache_ttl=10)
+        mock_response = MagicMock()
+        mock_response.content = b'{"results": []}'
+        now = [1000.0]
+        monkeypatch.setattr(time, "time", lambda: now[0])
+
+        with patch.object(engine._session, "get", return_value=mock_response):
+            engine._make_request("/search/movie", {"query": "A"})
+            now[0] += 20
+            engine._make_request("/search/movie", {"query": "B"})
+
+        assert [key[1] for key in engine._cache] == [(("query", "B"),)]
+
+    def test_make_request_does_not_retry_in_python(self):
+        """Test errors surface after one session call; retries live in the adapter."""
+        engine = TMDBSearchEngine(api_key="test_key")
 
-        with patch("requests.get") as mock_get:
+        with patch.object(engine._session, "get") as mock_get:
             mock_get.side_effect = requests.exceptions.Timeout("Timeout")
 
             with pytest.raises(requests.exceptions.Timeout):
                 engine._make_request("/search/movie")
 
-            assert mock_get.call_count == 2
+            assert mock_get.call_count == 1
 
     def test_make_request_http_error(self):
         """Test API request with HTTP error."""
@@ -165,7 +278,7 @@ class TestTMDBSearchEngineMakeRequest:
         mock_response = MagicMock()
         mock_response.raise_for_status.side_effect = requests.exceptions.HTTPError("404")
 
-        with patch("requests.get", return_value=mock_response):
+        with patch.object(engine._session, "get", return_value=mock_response):
             with pytest.raises(requests.exceptions.HTTPError):
                 engine._make_request("/search/movie")
 
@@ -248,7 +361,7 @@ class TestTMDBSearchEngineSearchMovie:
         with patch.object(engine, "_make_request") as mock_request:
             mock_request.side_effect = [
                 {"results": [{"id": 123, "title": "Inception"}]},
-                {"results": [{"site": "YouTube", "type": "Trailer", "key": "abc123"}]},
+                {"videos": {"results": [{"site": "YouTube", "type": "Trailer", "key": "abc123"}]}},
             ]
 
             result = engine.search_movie("Inception", year=2010)
@@ -258,7 +371,7 @@ class TestTMDBSearchEngineSearchMovie:
             mock_request.assert_any_call(
                 "/search/movie", {"query": "Inception", "language": "en-US", "year": 2010}
             )
-            mock_request.assert_any_call("/movie/123/videos")
+            mock_request.assert_any_call("/movie/123", {"append_to_response": "videos"})
 
     def test_search_movie_without_year(self):
         """Test searching for movie without year parameter."""
@@ -267,7 +380,7 @@ class TestTMDBSearchEngineSearchMovie:
         with patch.object(engine, "_make_request") as mock_request:
             mock_request.side_effect = [
                 {"results": [{"id": 456}]},
-                {"results": [{"site": "YouTube", "type": "Trailer", "key": "xyz789"}]},
+                {"videos": {"results": [{"site": "YouTube", "type": "Trailer", "key": "xyz789"}]}},
             ]
 
             result = engine.search_movie("Inception")
@@ -293,11 +406,19 @@ class TestTMDBSearchEngineSearchMovie:
         with patch.object(engine, "_make_request") as mock_request:
             mock_request.side_effect = [
                 {"results": [{"id": 123}]},
-                {"results": []},
+                {"videos": {"results": []}},
             ]
             result = engine.search_movie("Inception")
             assert not result
 
+    def test_search_movie_whitespace_title(self):
+        """Test searching with a whitespace-only title makes no API request."""
+        engine = TMDBSearchEngine(api_key="test_key")
+
+        with patch.object(engine, "_make_request") as mock_request:
+            assert not engine.search_movie("   ")
+            mock_request.assert_not_called()
+
     def test_search_movie_empty_title(self):
         """Test searching with empty title returns empty list."""
         engine = TMDBSearchEngine(api_key="test_key")
@@ -333,9 +454,11 @@ class TestTMDBSearchEngineSearchMovie:
                 {"results": []},  # Original search fails
                 {"results": [{"id": 123}]},  # Normalized search succeeds
                 {
-                    "results": [
-                        {"site": "YouTube", "type": "Trailer", "key": "abc123"},
-                    ]
+                    "videos": {
+                        "results": [
+                            {"site": "YouTube", "type": "Trailer", "key": "abc123"},
+                        ]
+                    }
                 },
             ]
             result = engine.search_movie("Astérix & Obélix")
@@ -365,7 +488,7 @@ class TestTMDBSearchEngineSearchTVShow:
         with patch.object(engine, "_make_request") as mock_request:
             mock_request.side_effect = [
                 {"results": [{"id": 789, "name": "Breaking Bad"}]},
-                {"results": [{"site": "YouTube", "type": "Trailer", "key": "tv123"}]},
+                {"videos": {"results": [{"site": "YouTube", "type": "Trailer", "key": "tv123"}]}},
             ]
 
             result = engine.search_tv_show("Breaking Bad", year=2008)
@@ -376,7 +499,7 @@ class TestTMDBSearchEngineSearchTVShow:
                 "/search/tv",
                 {"query": "Breaking Bad", "language": "en-US", "first_air_date_year": 2008},
             )
-            mock_request.assert_any_call("/tv/789/videos")
+            mock_request.assert_any_call("/tv/789", {"append_to_response": "videos"})
 
     def test_search_tv_show_without_year(self):
         """Test searching for TV show without year parameter."""
@@ -385,7 +508,11 @@ class TestTMDBSearchEngineSearchTVShow:
         with patch.object(engine, "_make_request") as mock_request:
             mock_request.side_effect = [
                 {"results": [{"id": 999}]},
-                {"results": [{"site": "YouTube", "type": "Trailer", "key": "show456"}]},
+                {
+                    "videos": {
+                        "results": [{"site": "YouTube", "type": "Trailer", "key": "show456"}]
+                    }
+                },
             ]
 
             result = engine.search_tv_show("Breaking Bad")
@@ -411,11 +538,19 @@ class TestTMDBSearchEngineSearchTVShow:
         with patch.object(engine, "_make_request") as mock_request:
             mock_request.side_effect = [
                 {"results": [{"id": 789}]},
-                {"results": []},
+                {"videos": {"results": []}},
             ]
             result = engine.search_tv_show("Breaking Bad")
             assert not result
 
+    def test_search_tv_show_whitespace_title(self):
+        """Test searching with a whitespace-only title makes no API request."""
+        engine = TMDBSearchEngine(api_key="test_key")
+
+        with patch.object(engine, "_make_request") as mock_request:
+            assert not engine.search_tv_show("   ")
+            mock_request.assert_not_called()
+
     def test_search_tv_show_empty_title(self):
         """Test searching with empty title returns empty list."""
         engine = TMDBSearchEngine(api_key="test_key")
@@ -451,9 +586,11 @@ class TestTMDBSearchEngineSearchTVShow:
                 {"results": []},  # Original search fails
                 {"results": [{"id": 789}]},  # Normalized search succeeds
                 {
-                    "results": [
-                        {"site": "YouTube", "type": "Trailer", "key": "xyz789"},
-                    ]
+                    "videos": {
+                        "results": [
+                            {"site": "YouTube", "type": "Trailer", "key": "xyz789"},
+                        ]
+                    }
                 },
             ]
             result = engine.search_tv_show("À l'aube de l'Amérique")
@@ -480,10 +617,12 @@ class TestTMDBSearchEngineSearchTVShow:
             mock_request.side_effect = [
                 {"results": [{"id": 789}]},
                 {
-                    "results": [
-                        {"site": "YouTube", "type": "Trailer", "key": "trailer1"},
-                        {"site": "YouTube", "type": "Trailer", "key": "trailer2"},
-                    ]
+                    "videos": {
+                        "results": [
+                            {"site": "YouTube", "type": "Trailer", "key": "trailer1"},
+                            {"site": "YouTube", "type": "Trailer", "key": "trailer2"},
+                        ]
+                    }
                 },
             ]
 
@@ -491,3 +630,167 @@ class TestTMDBSearchEngineSearchTVShow:
             assert len(result) == 2
             assert "https://www.youtube.com/watch?v=trailer1" in result
             assert "https://www.youtube.com/watch?v=trailer2" in result
+
+
+class TestTMDBSearchEngineSearchCache:
+    """Test the in-process LRU cache in front of search_movie/search_tv_show."""
+
+    @pytest.mark.parametrize("method", ["search_movie", "search_tv_show"])
+    def test_search_repeat_lookup_uses_cache(self, method):
+        """Test a repeated movie or TV show search makes no additional API requests."""
+        engine = TMDBSearchEngine(api_key="test_key")
+
+        with patch.object(engine, "_make_request") as mock_request:
+            mock_request.side_effect = [
+                {"results": [{"id": 123}]},
+                {"videos": {"results": [{"site": "YouTube", "type": "Trailer", "key": "abc"}]}},
+            ]
+            first = getattr(engine, method)("Inception")
+            second = getattr(engine, method)("Inception")
+
+        assert first == second == ["https://www.youtube.com/watch?v=abc"]
+        assert mock_request.call_count == 2
+
+    def test_search_cache_separates_media_types(self):
+        """Test movie and TV show results for the same title are cached separately."""
+        engine = TMDBSearchEngine(api_key="test_key")
+
+        with patch.object(engine, "_make_request", return_value={"results": []}) as mock_request:
+            engine.search_movie("Fargo")
+            engine.search_tv_show("Fargo")
+
+        assert mock_request.call_count == 2
+
+    def test_search_cache_evicts_least_recently_used(self):
+        """Test the oldest entry is evicted once search_cache_size is exceeded."""
+        engine = TMDBSearchEngine(api_key="test_key", search_cache_size=2)
+
+        with patch.object(engine, "_make_request", return_value={"results": []}):
+            engine.search_movie("A")
+            engine.search_movie("B")
+            engine.search_movie("A")  # Refresh A so B becomes least recently used
+            engine.search_movie("C")
+
+        assert list(engine._search_cache) == [("movie", "A", None), ("movie", "C", None)]
+
+    def test_search_errors_are_not_cached(self):
+        """Test a failed search is retried on the next call."""
+        engine = TMDBSearchEngine(api_key="test_key")
+
+        with patch.object(engine, "_make_request") as mock_request:
+            mock_request.side_effect = requests.exceptions.RequestException("API Error")
+            engine.search_tv_show("Breaking Bad")
+            engine.search_tv_show("Breaking Bad")
+
+        assert mock_request.call_count == 2
+        assert not engine._search_cache
+
+
+class TestTMDBSearchEngineAsyncSearch:
+    """Test the awaitable search_movie/search_tv_show variants."""
+
+    def test_async_search_movie_fans_out(self):
+        """Test gathering several async movie searches returns results in order."""
+        engine = TMDBSearchEngine(api_key="test_key")
+        titles = ["Inception", "Tenet", "Dunkirk"]
+
+        async def gather_all():
+            return await asyncio.gather(*(engine.async_search_movie(t) for t in titles))
+
+        with patch.object(
+            engine, "search_movie", side_effect=lambda title, year: [f"url-{title}"]
+        ) as mock_search:
+            results = asyncio.run(gather_all())
+
+        assert results == [["url-Inception"], ["url-Tenet"], ["url-Dunkirk"]]
+        assert mock_search.call_count == 3
+
+    def test_async_search_tv_show_delegates(self):
+        """Test async TV show search delegates to search_tv_show."""
+        engine = TMDBSearchEngine(api_key="test_key")
+
+        with patch.object(engine, "search_tv_show", return_value=["url"]) as mock_search:
+            result = asyncio.run(engine.async_search_tv_show("Breaking Bad", 2008))
+
+        assert result == ["url"]
+        mock_search.assert_called_once_with("Breaking Bad", 2008)
+
+    def test_search_movies_concurrent(self):
+        """Test batch movie search runs every query and preserves order."""
+        engine = TMDBSearchEngine(api_key="test_key")
+        ids = {"Inception": 1, "Tenet": 2, "Dunkirk": 3}
+
+        def fake_request(endpoint, params=None):
+            if endpoint == "/search/movie":
+                return {"results": [{"id": ids[params["query"]]}]}
+            video = {"site": "YouTube", "type": "Trailer", "key": endpoint.rsplit("/", 1)[-1]}
+            return {"videos": {"results": [video]}}
+
+        with patch.object(engine, "_make_request", side_effect=fake_request):
+            results = engine.search_movies(
+                [("Inception", 2010), ("Tenet", None), ("Dunkirk", 2017)]
+            )
+
+        assert results == [
+            ["https://www.youtube.com/watch?v=1"],
+            ["https://www.youtube.com/watch?v=2"],
+            ["https://www.youtube.com/watch?v=3"],
+        ]
+
+    def test_search_tv_shows_respects_max_concurrency(self):
+        """Test batch TV search never exceeds max_concurrency searches in flight."""
+        engine = TMDBSearchEngine(api_key="test_key")
+        in_flight = []
+        peak = []
+        lock = threading.Lock()
+
+        def fake_search(title, year):
+            with lock:
+                in_flight.append(title)
+                peak.append(len(in_flight))
+            time.sleep(0.01)
+            with lock:
+                in_flight.remove(title)
+            return [title]
+
+        with patch.object(engine, "search_tv_show", side_effect=fake_search):
+            results = engine.search_tv_shows([(f"Show {i}", None) for i in range(8)], 2)
+
+        assert results == [[f"Show {i}"] for i in range(8)]
+        assert max(peak) <= 2
+
+
+class TestTMDBSearchEngineSearchMany:
+    """Test the thread-pool batch search."""
+
+    def test_search_many_movies_preserves_order(self):
+        """Test 100 concurrent movie searches return correct results in order."""
+        engine = TMDBSearchEngine(api_key="test_key")
+        queries = [(f"Movie {i}", 2000 + i) for i in range(100)]
+
+        def fake_request(endpoint, params=None):
+            if endpoint == "/search/movie":
+                return {"results": [{"id": params["year"]}]}
+            video = {"site": "YouTube", "type": "Trailer", "key": endpoint.rsplit("/", 1)[-1]}
+            return {"videos": {"results": [video]}}
+
+        with patch.object(engine, "_make_request", side_effect=fake_request):
+            results = engine.search_many(queries)
+
+        assert results == [[f"https://www.youtube.com/watch?v={2000 + i}"] for i in range(100)]
+
+    def test_search_many_tv_shows(self):
+        """Test kind="tv" dispatches to search_tv_show."""
+        engine = TMDBSearchEngine(api_key="test_key")
+
+        with patch.object(engine, "search_tv_show", return_value=["url"]) as mock_search:
+            results = engine.search_many([("Breaking Bad", 2008)], kind="tv")
+
+        assert results == [["url"]]
+        mock_search.assert_called_once_with("Breaking Bad", 2008)
+
+    def test_search_many_unknown_kind_raises(self):
+        """Test an unknown kind raises ValueError."""
+        engine = TMDBSearchEngine(api_key="test_key")
+        with pytest.raises(ValueError, match="Unknown search kind"):
+            engine.search_many([("Inception", 2010)], kind="music")
@@ -12,11 +12,11 @@ def test_has_subdirectories_with_videos_no_videos_found(tmp_path):
     """Test _has_subdirectories_with_videos returns False when no videos found."""
     scanner = TVShowScanner()
     tvshow_dir = tmp_path / "Show"
-    tvshow_dir.mkdir()
 
-    # Create subdirectories without video files
+    # Create subdirectories without video files; mkdir(parents=True) creates the
+    # show directory along with the first season
     season1 = tvshow_dir / "Season 01"
-    season1.mkdir()
+    season1.mkdir(parents=True)
     (season1 / "readme.txt").touch()  # Not a video file
 
     season2 = tvshow_dir / "Season 02"
@@ -2,11 +2,26 @@
 # -*- coding: utf-8 -*-
 """Tests for TVShowScanner class."""
 
-from unittest.mock import patch
+import os
 
 import pytest
+from conftest import (  # pylint: disable=import-error
+    EPISODE1,
+    SEASON01,
+    THREE_SHOWS,
+    TRAILERS_DIR,
+)
 
-from youtubetrailerscraper.tvshowscanner import TVShowScanner
+from youtubetrailerscraper.tvshowscanner import ShowInfo, TVShowScanner
+
+
+def _raises(exc):
+    """Build a stand-in for os.scandir (or any callable) that always raises exc."""
+
+    def raiser(*args, **kwargs):
+        raise exc
+
+    return raiser
 
 
 class TestTVShowScannerInit:
@@ -28,409 +43,301 @@ class TestTVShowScannerInit:
         scanner = TVShowScanner(season_pattern="SEASON")
         assert scanner.season_pattern == "season"
 
+    def test_season_pattern_casefolded(self, tmp_path):
+        """Test that non-ASCII season patterns match caselessly via casefold()."""
+        scanner = TVShowScanner(season_pattern="Straße")
+        assert scanner.season_pattern == "strasse"
 
+        season = tmp_path / "Show" / "STRASSE 01"
+        season.mkdir(parents=True)
+        (season / EPISODE1).touch()
+        # pylint: disable=protected-access
+        assert scanner._is_tvshow_directory(tmp_path / "Show") is True
+
+
+@pytest.mark.xdist_group("tvshow_find")
 class TestTVShowScannerFindMissingTrailers:
     """Tests for find_missing_trailers method."""
 
-    def test_find_missing_trailers_single_directory(self, tmp_path):
+    @pytest.fixture(scope="class")
+    @classmethod
+    def scanner(cls):
+        """Share one TVShowScanner across the class; scanners hold no per-scan state."""
+        return TVShowScanner()
+
+    def test_find_missing_trailers_single_directory(self, scanner, tvshow_library):
         """Test finding missing trailers in a single directory."""
-        scanner = TVShowScanner()
+        base = tvshow_library / "single"
 
-        # TV show with trailer
-        tvshow1 = tmp_path / "Breaking Bad"
-        tvshow1.mkdir()
-        season1 = tvshow1 / "Season 01"
-        season1.mkdir()
-        (season1 / "episode1.mp4").write_text("fake video")
-        trailers_dir = tvshow1 / "trailers"
-        trailers_dir.mkdir()
-        (trailers_dir / "breaking-bad-trailer.mp4").write_text("fake trailer")  # Contains -trailer
-
-        # TV show without trailer
-        tvshow2 = tmp_path / "The Wire"
-        tvshow2.mkdir()
-        season1 = tvshow2 / "Season 01"
-        season1.mkdir()
-        (season1 / "episode1.mp4").write_text("fake video")
-
-        results = scanner.find_missing_trailers([tmp_path])
-        assert len(results) == 1
-        assert tvshow2 in results
-        assert tvshow1 not in results
-
-    def test_find_missing_trailers_multiple_directories(self, tmp_path):
-        """Test finding missing trailers across multiple directories."""
-        scanner = TVShowScanner()
+        results = scanner.find_missing_trailers([base])
+        # Breaking Bad has trailers/breaking-bad-trailer.mp4
+        assert results == [base / "The Wire"]
 
-        # First base directory
-        path1 = tmp_path / "disk1"
-        path1.mkdir()
-        tvshow1 = path1 / "Show1"
-        tvshow1.mkdir()
-        season1 = tvshow1 / "Season 01"
-        season1.mkdir()
-        (season1 / "episode1.mp4").write_text("fake video")
-
-        # Second base directory
-        path2 = tmp_path / "disk2"
-        path2.mkdir()
-        tvshow2 = path2 / "Show2"
-        tvshow2.mkdir()
-        season1 = tvshow2 / "Season 01"
-        season1.mkdir()
-        (season1 / "episode1.mp4").write_text("fake video")
+    def test_find_missing_trailers_multiple_directories(self, scanner, tvshow_library):
+        """Test finding missing trailers across multiple directories."""
+        path1 = tvshow_library / "disk1"
+        path2 = tvshow_library / "disk2"
 
         results = scanner.find_missing_trailers([path1, path2])
-        assert len(results) == 2
-        assert tvshow1 in results
-        assert tvshow2 in results
+        assert results == [path1 / "Show1", path2 / "Show2"]
+
+    def test_find_missing_trailers_keeps_path_order(self, scanner, tvshow_library):
+        """Test concurrently scanned base paths report results in argument order."""
+        paths = [tvshow_library / name for name in ("disk2", "single", "disk1")]
+
+        results = scanner.find_missing_trailers(paths)
+        assert results == [paths[0] / "Show2", paths[1] / "The Wire", paths[2] / "Show1"]
 
-    def test_find_missing_trailers_empty_paths_list(self):
+    def test_find_missing_trailers_empty_paths_list(self, scanner):
         """Test finding with empty paths list raises ValueError."""
-        scanner = TVShowScanner()
         with pytest.raises(ValueError, match="Paths list cannot be empty"):
             scanner.find_missing_trailers([])
 
-    def test_find_missing_trailers_all_have_trailers(self, tmp_path):
+    def test_find_missing_trailers_all_have_trailers(self, scanner, tvshow_library):
         """Test when all TV shows have trailers."""
-        scanner = TVShowScanner()
-
-        for i in range(3):
-            tvshow = tmp_path / f"Show{i}"
-            tvshow.mkdir()
-            season1 = tvshow / "Season 01"
-            season1.mkdir()
-            (season1 / "episode1.mp4").write_text("fake video")
-            trailers_dir = tvshow / "trailers"
-            trailers_dir.mkdir()
-            (trailers_dir / f"show{i}-trailer.mp4").write_text("fake trailer")  # Contains -trailer
-
-        results = scanner.find_missing_trailers([tmp_path])
+        results = scanner.find_missing_trailers([tvshow_library / "all_trailers"])
         assert len(results) == 0
 
-    def test_find_missing_trailers_none_have_trailers(self, tmp_path):
+    def test_find_missing_trailers_none_have_trailers(self, scanner, tvshow_library):
         """Test when no TV shows have trailers."""
-        scanner = TVShowScanner()
+        base = tvshow_library / "no_trailers"
+        results = scanner.find_missing_trailers([base])
+        # Sorted, not set(): scandir order is arbitrary and duplicates must still fail
+        assert sorted(results) == [base / show for show in THREE_SHOWS]
 
-        for i in range(3):
-            tvshow = tmp_path / f"Show{i}"
-            tvshow.mkdir()
-            season1 = tvshow / "Season 01"
-            season1.mkdir()
-            (season1 / "episode1.mp4").write_text("fake video")
-
-        results = scanner.find_missing_trailers([tmp_path])
-        assert len(results) == 3
-
-    def test_custom_trailer_subdir(self, tmp_path):
+    def test_custom_trailer_subdir(self, tvshow_library):
         """Test using custom trailer subdirectory with flexible trailer detection."""
         scanner = TVShowScanner(trailer_subdir="videos")
+        base = tvshow_library / "custom_subdir"
+
+        # Show1 has videos/show1-trailer.mp4, Show2 has no trailer
+        results = scanner.find_missing_trailers([base])
+        assert results == [base / "Show2"]
 
-        # TV show with custom trailer location (must contain 'trailer' in filename)
-        tvshow1 = tmp_path / "Show1"
-        tvshow1.mkdir()
-        season1 = tvshow1 / "Season 01"
-        season1.mkdir()
-        (season1 / "episode1.mp4").write_text("fake video")
-        videos_dir = tvshow1 / "videos"
-        videos_dir.mkdir()
-        (videos_dir / "show1-trailer.mp4").write_text("fake trailer")  # Contains 'trailer'
-
-        # TV show without custom trailer
-        tvshow2 = tmp_path / "Show2"
-        tvshow2.mkdir()
-        season1 = tvshow2 / "Season 01"
-        season1.mkdir()
-        (season1 / "episode1.mp4").write_text("fake video")
-
-        results = scanner.find_missing_trailers([tmp_path])
-        assert len(results) == 1
-        assert tvshow2 in results
-        assert tvshow1 not in results
-
-    def test_find_missing_trailers_nonexistent_path(self, tmp_path):
+    def test_find_missing_trailers_nonexistent_path(self, scanner, tvshow_library):
         """Test finding missing trailers with nonexistent path returns empty list."""
-        scanner = TVShowScanner()
-        nonexistent = tmp_path / "does_not_exist"
+        nonexistent = tvshow_library / "does_not_exist"
         results = scanner.find_missing_trailers([nonexistent])
         assert not results
 
-    def test_flexible_trailer_detection_various_extensions(self, tmp_path):
-        """Test that trailers with various extensions are detected."""
-        scanner = TVShowScanner()
-
-        # Create TV shows with trailers using different extensions
-        tvshow1 = tmp_path / "Show 1"
-        tvshow1.mkdir()
-        season1 = tvshow1 / "Season 01"
-        season1.mkdir()
-        (season1 / "episode1.mp4").write_text("fake video")
-        trailers_dir = tvshow1 / "trailers"
-        trailers_dir.mkdir()
-        (trailers_dir / "show-trailer.mkv").write_text("fake trailer")  # Different extension
-
-        tvshow2 = tmp_path / "Show 2"
-        tvshow2.mkdir()
-        season1 = tvshow2 / "Season 01"
-        season1.mkdir()
-        (season1 / "episode1.mp4").write_text("fake video")
-        trailers_dir = tvshow2 / "trailers"
-        trailers_dir.mkdir()
-        (trailers_dir / "show-trailer.avi").write_text("fake trailer")  # Different extension
-
-        missing = scanner.find_missing_trailers([tmp_path])
-        assert len(missing) == 0  # All have trailers despite different extensions
-
-    def test_flexible_trailer_detection_case_insensitive(self, tmp_path):
-        """Test that trailer detection is case-insensitive."""
-        scanner = TVShowScanner()
-
-        # Create TV shows with trailers using different case patterns
-        tvshow1 = tmp_path / "Show 1"
-        tvshow1.mkdir()
-        season1 = tvshow1 / "Season 01"
-        season1.mkdir()
-        (season1 / "episode1.mp4").write_text("fake video")
-        trailers_dir = tvshow1 / "trailers"
-        trailers_dir.mkdir()
-        (trailers_dir / "SHOW-TRAILER.mp4").write_text("fake trailer")  # Uppercase
-
-        tvshow2 = tmp_path / "Show 2"
-        tvshow2.mkdir()
-        season1 = tvshow2 / "Season 01"
-        season1.mkdir()
-        (season1 / "episode1.mp4").write_text("fake video")
-        trailers_dir = tvshow2 / "trailers"
-        trailers_dir.mkdir()
-        (trailers_dir / "Show-Trailer.mp4").write_text("fake trailer")  # Mixed case
-
-        missing = scanner.find_missing_trailers([tmp_path])
-        assert len(missing) == 0  # All have trailers despite different case
-
-    def test_flexible_trailer_detection_various_naming_patterns(self, tmp_path):
-        """Test that various naming patterns with '-trailer' are detected."""
-        scanner = TVShowScanner()
-
-        # Create TV shows with trailers using different naming patterns
-        tvshow1 = tmp_path / "Show 1"
-        tvshow1.mkdir()
-        season1 = tvshow1 / "Season 01"
-        season1.mkdir()
-        (season1 / "episode1.mp4").write_text("fake video")
-        trailers_dir = tvshow1 / "trailers"
-        trailers_dir.mkdir()
-        (trailers_dir / "official-trailer.mp4").write_text("fake trailer")
-
-        tvshow2 = tmp_path / "Show 2"
-        tvshow2.mkdir()
-        season1 = tvshow2 / "Season 01"
-        season1.mkdir()
-        (season1 / "episode1.mp4").write_text("fake video")
-        trailers_dir = tvshow2 / "trailers"
-        trailers_dir.mkdir()
-        (trailers_dir / "show-trailer-1080p.mp4").write_text("fake trailer")
-
-        missing = scanner.find_missing_trailers([tmp_path])
-        assert len(missing) == 0  # All have trailers with '-trailer' in name
-
-    def test_flexible_trailer_detection_without_trailer_keyword(self, tmp_path):
-        """Test that files without 'trailer' keyword are not considered trailers."""
-        scanner = TVShowScanner()
 
-        # Create TV shows with extra files but no actual trailer
-        tvshow1 = tmp_path / "Show 1"
-        tvshow1.mkdir()
-        season1 = tvshow1 / "Season 01"
-        season1.mkdir()
-        (season1 / "episode1.mp4").write_text("fake video")
-        trailers_dir = tvshow1 / "trailers"
-        trailers_dir.mkdir()
-        (trailers_dir / "show-preview.mp4").write_text("fake preview")  # Not a trailer
-
-        missing = scanner.find_missing_trailers([tmp_path])
-        assert len(missing) == 1  # Should be missing trailer
-
-    def test_flexible_trailer_detection_without_dash(self, tmp_path):
-        """Test that trailers without dash separator are also detected."""
-        scanner = TVShowScanner()
+@pytest.mark.xdist_group("tvshow_find")
+class TestTVShowScannerIterMissingTrailers:
+    """Tests for iter_missing_trailers method."""
 
-        # Create TV shows with trailers without dash
-        tvshow1 = tmp_path / "Show 1"
-        tvshow1.mkdir()
-        season1 = tvshow1 / "Season 01"
-        season1.mkdir()
-        (season1 / "episode1.mp4").write_text("fake video")
-        trailers_dir = tvshow1 / "trailers"
-        trailers_dir.mkdir()
-        (trailers_dir / "ShowTrailer.mp4").write_text("fake trailer")  # No dash
-
-        tvshow2 = tmp_path / "Show 2"
-        tvshow2.mkdir()
-        season1 = tvshow2 / "Season 01"
-        season1.mkdir()
-        (season1 / "episode1.mp4").write_text("fake video")
-        trailers_dir = tvshow2 / "trailers"
-        trailers_dir.mkdir()
-        (trailers_dir / "Show Trailer.mkv").write_text("fake trailer")  # Space
-
-        tvshow3 = tmp_path / "Show 3"
-        tvshow3.mkdir()
-        season1 = tvshow3 / "Season 01"
-        season1.mkdir()
-        (season1 / "episode1.mp4").write_text("fake video")
-        trailers_dir = tvshow3 / "trailers"
-        trailers_dir.mkdir()
-        (trailers_dir / "trailer.mp4").write_text("fake trailer")  # Just "trailer"
-
-        missing = scanner.find_missing_trailers([tmp_path])
-        assert len(missing) == 0  # All have trailers despite no dash
+    @pytest.fixture(scope="class")
+    @classmethod
+    def scanner(cls):
+        """Share one TVShowScanner across the class; scanners hold no per-scan state."""
+        return TVShowScanner()
 
+    def test_iter_missing_trailers_streams_results(self, scanner, tvshows_library_101):
+        """Test results are yielded lazily, one TV show at a time."""
+        stream = scanner.iter_missing_trailers([tvshows_library_101])
 
-class TestTVShowScannerHasTrailer:
-    """Test TVShowScanner.has_trailer() method."""
+        assert not isinstance(stream, list)
+        assert next(stream).parent == tvshows_library_101
+        assert len(list(stream)) == 100
 
-    def test_has_trailer_true_with_standard_naming(self, tmp_path):
-        """Test has_trailer returns True for standard trailer naming."""
-        scanner = TVShowScanner()
-        tvshow_dir = tmp_path / "Show"
-        tvshow_dir.mkdir()
-        season1 = tvshow_dir / "Season 01"
-        season1.mkdir()
-        (season1 / "episode1.mp4").write_text("fake video")
-        trailers_dir = tvshow_dir / "trailers"
-        trailers_dir.mkdir()
-        (trailers_dir / "show-trailer.mp4").write_text("fake trailer")
-
-        assert scanner.has_trailer(tvshow_dir) is True
-
-    def test_has_trailer_true_case_insensitive(self, tmp_path):
-        """Test has_trailer returns True for case-insensitive trailer names."""
-        scanner = TVShowScanner()
-        tvshow_dir = tmp_path / "Show"
-        tvshow_dir.mkdir()
-        season1 = tvshow_dir / "Season 01"
-        season1.mkdir()
-        (season1 / "episode1.mp4").write_text("fake video")
-        trailers_dir = tvshow_dir / "trailers"
-        trailers_dir.mkdir()
-        (trailers_dir / "SHOW-TRAILER.mp4").write_text("fake trailer")
-
-        assert scanner.has_trailer(tvshow_dir) is True
-
-    def test_has_trailer_true_various_extensions(self, tmp_path):
-        """Test has_trailer returns True for trailers with various extensions."""
-        scanner = TVShowScanner()
-        tvshow_dir = tmp_path / "Show"
-        tvshow_dir.mkdir()
-        season1 = tvshow_dir / "Season 01"
-        season1.mkdir()
-        (season1 / "episode1.mp4").write_text("fake video")
-        trailers_dir = tvshow_dir / "trailers"
-        trailers_dir.mkdir()
-        (trailers_dir / "show-trailer.mkv").write_text("fake trailer")
-
-        assert scanner.has_trailer(tvshow_dir) is True
-
-    def test_has_trailer_false_no_trailers_dir(self, tmp_path):
-        """Test has_trailer returns False when trailers directory doesn't exist."""
-        scanner = TVShowScanner()
-        tvshow_dir = tmp_path / "Show"
-        tvshow_dir.mkdir()
-        season1 = tvshow_dir / "Season 01"
-        season1.mkdir()
-        (season1 / "episode1.mp4").write_text("fake video")
+    def test_iter_missing_trailers_scans_repeated_paths_once(
+        self, scanner, tvshow_library, monkeypatch
+    ):
+        """Test a base path listed twice is only scanned (and reported) once."""
+        classified = []
+        inspect_show = TVShowScanner._inspect_show  # pylint: disable=protected-access
 
-        assert scanner.has_trailer(tvshow_dir) is False
+        def counting(self, directory, check_trailer=True):
+            classified.append(os.fspath(directory))
+            return inspect_show(self, directory, check_trailer)
 
-    def test_has_trailer_false_no_trailer_files(self, tmp_path):
-        """Test has_trailer returns False when trailers dir exists but no trailer files."""
-        scanner = TVShowScanner()
-        tvshow_dir = tmp_path / "Show"
-        tvshow_dir.mkdir()
-        season1 = tvshow_dir / "Season 01"
-        season1.mkdir()
-        (season1 / "episode1.mp4").write_text("fake video")
-        trailers_dir = tvshow_dir / "trailers"
-        trailers_dir.mkdir()
+        monkeypatch.setattr(TVShowScanner, "_inspect_show", counting)
+        base = tvshow_library / "disk1"
 
-        assert scanner.has_trailer(tvshow_dir) is False
+        assert list(scanner.iter_missing_trailers([base, base])) == [base / "Show1"]
+        assert classified == [os.fspath(base / "Show1")]
 
-    def test_has_trailer_false_without_trailer_keyword(self, tmp_path):
-        """Test has_trailer returns False for files without 'trailer' keyword."""
-        scanner = TVShowScanner()
-        tvshow_dir = tmp_path / "Show"
-        tvshow_dir.mkdir()
-        season1 = tvshow_dir / "Season 01"
-        season1.mkdir()
-        (season1 / "episode1.mp4").write_text("fake video")
-        trailers_dir = tvshow_dir / "trailers"
-        trailers_dir.mkdir()
-        (trailers_dir / "show-preview.mp4").write_text("fake preview")
+    def test_iter_missing_trailers_empty_paths_raises_eagerly(self, scanner):
+        """Test empty paths raise ValueError before iteration starts."""
+        with pytest.raises(ValueError, match="Paths list cannot be empty"):
+            scanner.iter_missing_trailers([])
+
+
+# Show name in the tvshow_library "shows" scenario -> whether it has a trailer
+TRAILER_CASES = {
+    "standard": True,  # show-trailer.mp4
+    "uppercase": True,  # SHOW-TRAILER.mp4
+    "mixed_case": True,  # Show-Trailer.mp4
+    "mkv": True,  # show-trailer.mkv
+    "avi": True,  # show-trailer.avi
+    "official": True,  # official-trailer.mp4
+    "resolution": True,  # show-trailer-1080p.mp4
+    "no_dash": True,  # ShowTrailer.mp4
+    "spaced": True,  # "Show Trailer.mkv"
+    "just_trailer": True,  # trailer.mp4
+    "preview": False,  # show-preview.mp4 lacks the keyword
+    "empty_trailers": False,  # trailers/ exists but is empty
+    "no_trailers_dir": False,  # no trailers/ at all
+}
+
+
+@pytest.mark.xdist_group("tvshow_find")
+class TestTVShowScannerTrailerDetection:
+    """Table-driven trailer detection through has_trailer and find_missing_trailers."""
+
+    @pytest.fixture(scope="class")
+    @classmethod
+    def scanner(cls):
+        """Share one TVShowScanner across the class; scanners hold no per-scan state."""
+        return TVShowScanner()
+
+    @pytest.fixture(scope="class")
+    @classmethod
+    def missing_trailers(cls, scanner, tvshow_library):
+        """Scan the table's shows once, bypassing CacheIt's persistent disk cache."""
+        # pylint: disable=no-member  # __wrapped__ exists on CacheIt decorated methods
+        return scanner.find_missing_trailers.__wrapped__(scanner, [tvshow_library / "shows"])
+
+    @pytest.fixture(params=list(TRAILER_CASES))
+    def trailer_case(self, request, tvshow_library):
+        """Yield (show directory, expected has_trailer result) for each table row."""
+        return tvshow_library / "shows" / request.param, TRAILER_CASES[request.param]
+
+    def test_has_trailer(self, scanner, trailer_case):
+        """Test has_trailer matches the expected result for each naming case."""
+        show_dir, expected = trailer_case
+        assert scanner.has_trailer(show_dir) is expected
+
+    def test_find_missing_trailers(self, missing_trailers, trailer_case):
+        """Test find_missing_trailers reports exactly the shows without a trailer."""
+        show_dir, expected = trailer_case
+        assert (show_dir in missing_trailers) is not expected
+
+
+@pytest.mark.xdist_group("tvshow_has_trailer")
+class TestTVShowScannerInspectShow:
+    """Tests for _inspect_show method."""
+
+    @pytest.fixture(scope="class")
+    @classmethod
+    def scanner(cls):
+        """Share one TVShowScanner across the class; scanners hold no per-scan state."""
+        return TVShowScanner()
+
+    @pytest.mark.parametrize(
+        "relative, expected",
+        [
+            ("shows/standard", ShowInfo(is_tvshow=True, has_trailer=True)),
+            ("shows/no_trailers_dir", ShowInfo(is_tvshow=True, has_trailer=False)),
+            ("shows/standard/trailers", ShowInfo(is_tvshow=False, has_trailer=False)),
+        ],
+    )
+    def test_inspect_show(self, scanner, tvshow_library, relative, expected):
+        """Test _inspect_show reports show classification and trailer presence."""
+        # pylint: disable=protected-access
+        assert scanner._inspect_show(tvshow_library / relative) == expected
+
+    def test_inspect_show_skips_trailer_probe_without_trailer_dir(
+        self, scanner, tvshow_library, monkeypatch
+    ):
+        """Test shows without a trailers subdirectory never reach has_trailer."""
+        monkeypatch.setattr(TVShowScanner, "has_trailer", _raises(AssertionError("probed")))
+        # pylint: disable=protected-access
+        info = scanner._inspect_show(tvshow_library / "shows" / "no_trailers_dir")
+        assert info == ShowInfo(is_tvshow=True, has_trailer=False)
+
+    def test_inspect_show_matches_trailer_dir_case_insensitively(
+        self, scanner, tmp_path, monkeypatch
+    ):
+        """Test a differently cased trailers folder is still probed with has_trailer."""
+        show = tmp_path / "Show"
+        (show / SEASON01).mkdir(parents=True)
+        (show / SEASON01 / EPISODE1).touch()
+        (show / "Trailers").mkdir()
+        # Stand in for a case-insensitive filesystem where show/trailers resolves
+        monkeypatch.setattr(TVShowScanner, "has_trailer", lambda self, tvshow_dir: True)
+        # pylint: disable=protected-access
+        assert scanner._inspect_show(show) == ShowInfo(is_tvshow=True, has_trailer=True)
+
+
+@pytest.mark.xdist_group("tvshow_has_trailer")
+class TestTVShowScannerHasTrailer:
+    """Test TVShowScanner.has_trailer() method."""
 
+    @pytest.fixture(scope="class")
+    @classmethod
+    def scanner(cls):
+        """Share one TVShowScanner across the class; scanners hold no per-scan state."""
+        return TVShowScanner()
+
+    def test_has_trailer_ignores_trailer_named_directory(self, scanner, tmp_path):
+        """Test has_trailer only counts files, not directories named like a trailer."""
+        show = tmp_path / "Show"
+        (show / TRAILERS_DIR / "old-trailer").mkdir(parents=True)
+        assert scanner.has_trailer(show) is False
+
+    def test_has_trailer_false_when_trailer_subdir_is_file(self, scanner, tmp_path):
+        """Test has_trailer returns False when the trailers entry is a plain file."""
+        show = tmp_path / "Show"
+        show.mkdir()
+        (show / TRAILERS_DIR).touch()
+        assert scanner.has_trailer(show) is False
+
+    @pytest.mark.parametrize(
+        "exc",
+        [PermissionError("Access denied"), OSError("Disk error")],
+        ids=lambda exc: type(exc).__name__,
+    )
+    def test_has_trailer_handles_scandir_errors(self, scanner, tvshow_library, monkeypatch, exc):
+        """Test has_trailer handles PermissionError and OSError gracefully."""
+        tvshow_dir = tvshow_library / "shows" / "standard"
+
+        # Make os.scandir raise the error
+        monkeypatch.setattr("os.scandir", _raises(exc))
         assert scanner.has_trailer(tvshow_dir) is False
 
-    def test_has_trailer_true_without_dash(self, tmp_path):
-        """Test has_trailer returns True for trailers without dash separator."""
-        scanner = TVShowScanner()
-        tvshow_dir = tmp_path / "Show"
-        tvshow_dir.mkdir()
-        season1 = tvshow_dir / "Season 01"
-        season1.mkdir()
-        (season1 / "episode1.mp4").write_text("fake video")
-        trailers_dir = tvshow_dir / "trailers"
-        trailers_dir.mkdir()
-        (trailers_dir / "ShowTrailer.mp4").write_text("fake trailer")
-
-        assert scanner.has_trailer(tvshow_dir) is True
-
-    def test_has_trailer_true_just_trailer(self, tmp_path):
-        """Test has_trailer returns True for file named just 'trailer'."""
-        scanner = TVShowScanner()
-        tvshow_dir = tmp_path / "Show"
-        tvshow_dir.mkdir()
-        season1 = tvshow_dir / "Season 01"
-        season1.mkdir()
-        (season1 / "episode1.mp4").write_text("fake video")
-        trailers_dir = tvshow_dir / "trailers"
-        trailers_dir.mkdir()
-        (trailers_dir / "trailer.mp4").write_text("fake trailer")
-
-        assert scanner.has_trailer(tvshow_dir) is True
-
-    def test_has_trailer_handles_permission_error(self, tmp_path):
-        """Test has_trailer handles permission errors gracefully."""
-        scanner = TVShowScanner()
-        tvshow_dir = tmp_path / "Show"
-        tvshow_dir.mkdir()
-        trailers_dir = tvshow_dir / "trailers"
-        trailers_dir.mkdir()
-
-        # Mock iterdir to raise PermissionError using Path class
-        with patch("pathlib.Path.iterdir", side_effect=PermissionError("Access denied")):
-            assert scanner.has_trailer(tvshow_dir) is False
-
 
+@pytest.mark.xdist_group("tvshow_is_tvshow_dir")
 class TestTVShowScannerIsTvShowDirectory:
     """Tests for _is_tvshow_directory method."""
 
-    def test_is_tvshow_directory_with_permission_error(self, tmp_path):
-        """Test _is_tvshow_directory handles PermissionError gracefully."""
-        scanner = TVShowScanner()
-        tvshow = tmp_path / "restricted"
-        tvshow.mkdir()
-
-        # Mock Path.iterdir to raise PermissionError
-        with patch.object(type(tvshow), "iterdir", side_effect=PermissionError("Access denied")):
-            # pylint: disable=protected-access
-            assert scanner._is_tvshow_directory(tvshow) is False
-
-    def test_is_tvshow_directory_with_os_error(self, tmp_path):
-        """Test _is_tvshow_directory handles OSError gracefully."""
-        scanner = TVShowScanner()
-        tvshow = tmp_path / "broken"
-        tvshow.mkdir()
-
-        # Mock Path.iterdir to raise OSError
-        with patch.object(type(tvshow), "iterdir", side_effect=OSError("Disk error")):
-            # pylint: disable=protected-access
-            assert scanner._is_tvshow_directory(tvshow) is False
+    @pytest.fixture(scope="class")
+    @classmethod
+    def scanner(cls):
+        """Share one TVShowScanner across the class; scanners hold no per-scan state."""
+        return TVShowScanner()
+
+    @pytest.mark.parametrize(
+        "exc",
+        [PermissionError("Access denied"), OSError("Disk error")],
+        ids=lambda exc: type(exc).__name__,
+    )
+    def test_is_tvshow_directory_handles_scandir_errors(
+        self, scanner, tvshow_library, monkeypatch, exc
+    ):
+        """Test _is_tvshow_directory handles PermissionError and OSError gracefully."""
+        tvshow = tvshow_library / "shows" / "standard"
+
+        # Make os.scandir raise the error
+        monkeypatch.setattr("os.scandir", _raises(exc))
+        # pylint: disable=protected-access
+        assert scanner._is_tvshow_directory(tvshow) is False
+
+    def test_is_tvshow_directory_stops_at_first_season_with_videos(
+        self, scanner, tmp_path, monkeypatch
+    ):
+        """Test _is_tvshow_directory returns on the first qualifying season directory."""
+        show = tmp_path / "Show"
+        for season in (SEASON01, "Season 02", "Season 03"):
+            (show / season).mkdir(parents=True)
+            (show / season / EPISODE1).touch()
+
+        checked = []
+
+        def has_video_files(directory):
+            checked.append(directory)
+            return True
+
+        monkeypatch.setattr(TVShowScanner, "_has_video_files", staticmethod(has_video_files))
+        # pylint: disable=protected-access
+        assert scanner._is_tvshow_directory(show) is True
+        assert len(checked) == 1
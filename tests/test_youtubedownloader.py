@@ -3,11 +3,25 @@
 """Tests for YoutubeDownloader class."""
 
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock, Mock, patch
+
+from yt_dlp import YoutubeDL
 
 from youtubetrailerscraper.youtubedownloader import YoutubeDownloader
 
 
+def _mock_ydl():
+    """Build a YoutubeDL stand-in limited to the real class's attributes.
+
+    params is an instance attribute set in YoutubeDL.__init__, so the spec does
+    not provide it; it holds outtmpl in the normalized dict form that
+    _download_many retargets per URL.
+    """
+    mock_instance = Mock(spec=YoutubeDL)
+    mock_instance.params = {"outtmpl": {"default": ""}}
+    return mock_instance
+
+
 class TestYoutubeDownloaderInit:
     """Tests for YoutubeDownloader initialization."""
 
@@ -59,7 +73,7 @@ class TestYoutubeDownloaderDownload:
         """Test download skips if file already exists."""
         downloader = YoutubeDownloader()
         output_file = tmp_path / "test-trailer.mp4"
-        output_file.write_text("fake video")
+        output_file.touch()
 
         result = downloader.download(
             "https://youtube.com/watch?v=abc123", tmp_path, "test-trailer"
@@ -72,7 +86,7 @@ class TestYoutubeDownloaderDownload:
     def test_download_successful(self, mock_ytdl, tmp_path):
         """Test successful download."""
         # Setup mock
-        mock_instance = MagicMock()
+        mock_instance = _mock_ydl()
         mock_ytdl.return_value.__enter__.return_value = mock_instance
         mock_instance.download.return_value = None
 
@@ -87,7 +101,7 @@ class TestYoutubeDownloaderDownload:
     @patch("yt_dlp.YoutubeDL")
     def test_download_creates_output_directory(self, mock_ytdl, tmp_path):
         """Test download creates output directory if it doesn't exist."""
-        mock_instance = MagicMock()
+        mock_instance = _mock_ydl()
         mock_ytdl.return_value.__enter__.return_value = mock_instance
 
         output_dir = tmp_path / "nested" / "dir"
@@ -99,7 +113,7 @@ class TestYoutubeDownloaderDownload:
     @patch("yt_dlp.YoutubeDL")
     def test_download_handles_ytdl_error(self, mock_ytdl, tmp_path):
         """Test download handles yt-dlp errors gracefully."""
-        mock_instance = MagicMock()
+        mock_instance = _mock_ydl()
         mock_ytdl.return_value.__enter__.return_value = mock_instance
         mock_instance.download.side_effect = Exception("Download failed")
 
@@ -113,7 +127,7 @@ class TestYoutubeDownloaderDownload:
     @patch("yt_dlp.YoutubeDL")
     def test_download_configures_ytdl_options_correctly(self, mock_ytdl, tmp_path):
         """Test download configures yt-dlp with correct options."""
-        mock_instance = MagicMock()
+        mock_instance = _mock_ydl()
         mock_ytdl.return_value.__enter__.return_value = mock_instance
 
         downloader = YoutubeDownloader()
@@ -140,7 +154,7 @@ class TestYoutubeDownloaderDownload:
     @patch("yt_dlp.YoutubeDL")
     def test_download_with_cookies_from_browser(self, mock_ytdl, tmp_path):
         """Test download uses cookies_from_browser when configured."""
-        mock_instance = MagicMock()
+        mock_instance = _mock_ydl()
         mock_ytdl.return_value.__enter__.return_value = mock_instance
 
         downloader = YoutubeDownloader(cookies_from_browser="firefox")
@@ -156,7 +170,7 @@ class TestYoutubeDownloaderDownload:
     @patch("yt_dlp.YoutubeDL")
     def test_download_with_cookies_file(self, mock_ytdl, tmp_path):
         """Test download uses cookies_file when configured."""
-        mock_instance = MagicMock()
+        mock_instance = _mock_ydl()
         mock_ytdl.return_value.__enter__.return_value = mock_instance
 
         downloader = YoutubeDownloader(cookies_file="/path/to/cookies.txt")
@@ -172,7 +186,7 @@ class TestYoutubeDownloaderDownload:
     @patch("yt_dlp.YoutubeDL")
     def test_download_cookies_from_browser_takes_precedence(self, mock_ytdl, tmp_path):
         """Test cookies_from_browser takes precedence over cookies_file."""
-        mock_instance = MagicMock()
+        mock_instance = _mock_ydl()
         mock_ytdl.return_value.__enter__.return_value = mock_instance
 
         downloader = YoutubeDownloader(
@@ -188,6 +202,19 @@ class TestYoutubeDownloaderDownload:
         assert opts["cookiesfrombrowser"] == ("chrome",)
         assert "cookiefile" not in opts
 
+    @patch("yt_dlp.YoutubeDL")
+    def test_download_does_not_leak_options_between_downloaders(self, mock_ytdl, tmp_path):
+        """Test per-download options never end up in the shared base options."""
+        YoutubeDownloader(cookies_file="/path/to/cookies.txt").download(
+            "https://youtube.com/watch?v=abc123", tmp_path, "first"
+        )
+        YoutubeDownloader().download("https://youtube.com/watch?v=abc123", tmp_path, "second")
+
+        opts = mock_ytdl.call_args[0][0]
+        assert "cookiefile" not in opts
+        assert opts["outtmpl"] == str(tmp_path / "second.mp4")
+        assert "outtmpl" not in YoutubeDownloader._BASE_OPTS  # pylint: disable=protected-access
+
 
 class TestYoutubeDownloaderMovieTrailers:
     """Tests for download_trailers_for_movie method."""
@@ -195,7 +222,7 @@ class TestYoutubeDownloaderMovieTrailers:
     @patch("yt_dlp.YoutubeDL")
     def test_download_trailers_for_movie_single_trailer(self, mock_ytdl, tmp_path):
         """Test downloading a single trailer for a movie."""
-        mock_instance = MagicMock()
+        mock_instance = _mock_ydl()
         mock_ytdl.return_value.__enter__.return_value = mock_instance
 
         movie_dir = tmp_path / "Inception (2010)"
@@ -212,7 +239,7 @@ class TestYoutubeDownloaderMovieTrailers:
     @patch("yt_dlp.YoutubeDL")
     def test_download_trailers_for_movie_multiple_trailers(self, mock_ytdl, tmp_path):
         """Test downloading multiple trailers for a movie."""
-        mock_instance = MagicMock()
+        mock_instance = _mock_ydl()
         mock_ytdl.return_value.__enter__.return_value = mock_instance
 
         movie_dir = tmp_path / "The Matrix (1999)"
@@ -240,7 +267,7 @@ class TestYoutubeDownloaderMovieTrailers:
     @patch("yt_dlp.YoutubeDL")
     def test_download_trailers_for_movie_handles_failures(self, mock_ytdl, tmp_path):
         """Test download_trailers_for_movie handles individual failures."""
-        mock_instance = MagicMock()
+        mock_instance = _mock_ydl()
         mock_ytdl.return_value.__enter__.return_value = mock_instance
         # First download succeeds, second fails
         mock_instance.download.side_effect = [None, Exception("Failed")]
@@ -262,7 +289,7 @@ class TestYoutubeDownloaderMovieTrailers:
     @patch("yt_dlp.YoutubeDL")
     def test_download_trailers_for_movie_limits_to_max_trailers(self, mock_ytdl, tmp_path):
         """Test download_trailers_for_movie limits downloads to MAX_TRAILERS_PER_MEDIA."""
-        mock_instance = MagicMock()
+        mock_instance = _mock_ydl()
         mock_ytdl.return_value.__enter__.return_value = mock_instance
 
         movie_dir = tmp_path / "Popular Movie (2023)"
@@ -295,7 +322,7 @@ class TestYoutubeDownloaderTVShowTrailers:
     @patch("yt_dlp.YoutubeDL")
     def test_download_trailers_for_tvshow_single_trailer(self, mock_ytdl, tmp_path):
         """Test downloading a single trailer for a TV show."""
-        mock_instance = MagicMock()
+        mock_instance = _mock_ydl()
         mock_ytdl.return_value.__enter__.return_value = mock_instance
 
         tvshow_dir = tmp_path / "Breaking Bad"
@@ -313,7 +340,7 @@ class TestYoutubeDownloaderTVShowTrailers:
     @patch("yt_dlp.YoutubeDL")
     def test_download_trailers_for_tvshow_multiple_trailers(self, mock_ytdl, tmp_path):
         """Test downloading multiple trailers for a TV show."""
-        mock_instance = MagicMock()
+        mock_instance = _mock_ydl()
         mock_ytdl.return_value.__enter__.return_value = mock_instance
 
         tvshow_dir = tmp_path / "Stranger Things"
@@ -334,7 +361,7 @@ class TestYoutubeDownloaderTVShowTrailers:
     @patch("yt_dlp.YoutubeDL")
     def test_download_trailers_for_tvshow_creates_trailers_subdir(self, mock_ytdl, tmp_path):
         """Test that trailers subdirectory is created if it doesn't exist."""
-        mock_instance = MagicMock()
+        mock_instance = _mock_ydl()
         mock_ytdl.return_value.__enter__.return_value = mock_instance
 
         tvshow_dir = tmp_path / "Game of Thrones"
@@ -357,7 +384,7 @@ class TestYoutubeDownloaderTVShowTrailers:
     @patch("yt_dlp.YoutubeDL")
     def test_download_trailers_for_tvshow_handles_failures(self, mock_ytdl, tmp_path):
         """Test download_trailers_for_tvshow handles individual failures."""
-        mock_instance = MagicMock()
+        mock_instance = _mock_ydl()
         mock_ytdl.return_value.__enter__.return_value = mock_instance
         # First two succeed, third fails
         mock_instance.download.side_effect = [None, None, Exception("Failed")]
@@ -381,7 +408,7 @@ class TestYoutubeDownloaderTVShowTrailers:
     @patch("yt_dlp.YoutubeDL")
     def test_download_trailers_for_tvshow_limits_to_max_trailers(self, mock_ytdl, tmp_path):
         """Test download_trailers_for_tvshow limits downloads to MAX_TRAILERS_PER_MEDIA."""
-        mock_instance = MagicMock()
+        mock_instance = _mock_ydl()
         mock_ytdl.return_value.__enter__.return_value = mock_instance
 
         tvshow_dir = tmp_path / "Popular Series"
@@ -407,3 +434,63 @@ class TestYoutubeDownloaderTVShowTrailers:
 
         # Verify only 3 download calls were made
         assert mock_instance.download.call_count == 3
+
+
+class TestYoutubeDownloaderDownloadMany:
+    """Tests for _download_many, the shared YoutubeDL path of the trailer downloads."""
+
+    @patch("yt_dlp.YoutubeDL")
+    def test_download_many_reuses_one_youtubedl(self, mock_ytdl, tmp_path):
+        """Test all URLs of one media item go through a single retargeted YoutubeDL."""
+        mock_instance = _mock_ydl()
+        mock_ytdl.return_value.__enter__.return_value = mock_instance
+        targets = []
+        mock_instance.download.side_effect = lambda urls: targets.append(
+            mock_instance.params["outtmpl"]["default"]
+        )
+
+        downloader = YoutubeDownloader()
+        jobs = [
+            ("https://youtube.com/watch?v=a", "trailer #1"),
+            ("https://youtube.com/watch?v=b", "trailer #2"),
+        ]
+        # pylint: disable=protected-access
+        result = downloader._download_many(jobs, tmp_path)
+
+        assert result == [tmp_path / "trailer #1.mp4", tmp_path / "trailer #2.mp4"]
+        assert mock_ytdl.call_count == 1
+        assert targets == [str(path) for path in result]
+
+    def test_youtubedl_keeps_outtmpl_as_dict(self, tmp_path):
+        """Test real yt-dlp exposes the outtmpl mapping _download_many retargets."""
+        output_path = str(tmp_path / "trailer #1.mp4")
+        # pylint: disable=protected-access
+        with YoutubeDL(YoutubeDownloader()._build_ydl_opts(output_path)) as ydl:
+            assert ydl.params["outtmpl"]["default"] == output_path
+
+    @patch("yt_dlp.YoutubeDL")
+    def test_download_many_skips_existing_and_empty(self, mock_ytdl, tmp_path):
+        """Test existing files and empty URLs never create a YoutubeDL instance."""
+        (tmp_path / "trailer #1.mp4").touch()
+
+        downloader = YoutubeDownloader()
+        jobs = [("https://youtube.com/watch?v=a", "trailer #1"), ("", "trailer #2")]
+        # pylint: disable=protected-access
+        result = downloader._download_many(jobs, tmp_path)
+
+        assert result == [tmp_path / "trailer #1.mp4"]
+        mock_ytdl.assert_not_called()
+
+    @patch("yt_dlp.YoutubeDL")
+    def test_download_many_handles_youtubedl_init_error(self, mock_ytdl, tmp_path):
+        """Test a YoutubeDL construction failure is logged per URL, not raised."""
+        mock_ytdl.side_effect = Exception("bad options")
+
+        downloader = YoutubeDownloader()
+        jobs = [
+            ("https://youtube.com/watch?v=a", "trailer #1"),
+            ("https://youtube.com/watch?v=b", "trailer #2"),
+        ]
+        # pylint: disable=protected-access
+        assert not downloader._download_many(jobs, tmp_path)
+        assert mock_ytdl.call_count == 2
@@ -1,292 +1,161 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 # pylint: disable=duplicate-code
-"""Tests for YoutubeTrailerScraper main functionality (scanning, caching, searching)."""
-
-import os
-import tempfile
-
-from youtubetrailerscraper import YoutubeTrailerScraper  # pylint: disable=import-error
-
-
-def test_scan_for_movies_without_trailers_empty_paths():
-    """Test scan_for_movies_without_trailers with empty movies_paths."""
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".env", delete=False) as f:
-        f.write("TMDB_API_KEY=test_api_key\n")
-        f.write("TMDB_READ_ACCESS_TOKEN=test_token\n")
-        f.write("MOVIES_PATHS=[]\n")
-        f.write('TVSHOWS_PATHS=["/path/to/tvshows/"]\n')
-        f.write('TMDB_LANGUAGES=["en-US"]\n')
-        env_file = f.name
-
-    try:
-        scraper = YoutubeTrailerScraper(env_file=env_file)
-        results = scraper.scan_for_movies_without_trailers()
-        assert not results
-    finally:
-        os.unlink(env_file)
-
-
-def test_scan_for_movies_with_sample_mode(tmp_path):
-    """Test scan_for_movies_without_trailers with sample mode enabled."""
-    # Create test movies
-    for i in range(5):
-        movie = tmp_path / f"Movie{i}"
-        movie.mkdir()
-        (movie / "movie.mp4").write_text("fake video")
-
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".env", delete=False) as f:
-        f.write("TMDB_API_KEY=test_api_key\n")
-        f.write("TMDB_READ_ACCESS_TOKEN=test_token\n")
-        f.write(f'MOVIES_PATHS=["{str(tmp_path)}/"]\n')
-        f.write('TVSHOWS_PATHS=["/path/to/tvshows/"]\n')
-        f.write('TMDB_LANGUAGES=["en-US"]\n')
-        f.write("SCAN_SAMPLE_SIZE=3\n")
-        f.write("USE_SMB_MOUNT=false\n")  # Disable SMB mount
-        env_file = f.name
-
-    try:
-        scraper = YoutubeTrailerScraper(env_file=env_file)
-        results = scraper.scan_for_movies_without_trailers(use_sample=True)
-        # Sample mode IS supported with CacheIt via sample_size parameter
-        assert len(results) == 3
-    finally:
-        os.unlink(env_file)
-
-
-def test_scan_for_tvshows_without_trailers_empty_paths():
-    """Test scan_for_tvshows_without_trailers with empty tvshows_paths."""
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".env", delete=False) as f:
-        f.write("TMDB_API_KEY=test_api_key\n")
-        f.write("TMDB_READ_ACCESS_TOKEN=test_token\n")
-        f.write('MOVIES_PATHS=["/path/to/movies/"]\n')
-        f.write("TVSHOWS_PATHS=[]\n")
-        f.write('TMDB_LANGUAGES=["en-US"]\n')
-        env_file = f.name
-
-    try:
-        scraper = YoutubeTrailerScraper(env_file=env_file)
-        results = scraper.scan_for_tvshows_without_trailers()
-        assert not results
-    finally:
-        os.unlink(env_file)
-
-
-def test_scan_for_tvshows_with_sample_mode(tmp_path):
-    """Test scan_for_tvshows_without_trailers with sample mode enabled."""
-    # Create test TV shows
-    for i in range(5):
-        tvshow = tmp_path / f"Show{i}"
-        tvshow.mkdir()
-        season1 = tvshow / "Season 01"
-        season1.mkdir()
-        (season1 / "episode.mp4").write_text("fake video")
-
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".env", delete=False) as f:
-        f.write("TMDB_API_KEY=test_api_key\n")
-        f.write("TMDB_READ_ACCESS_TOKEN=test_token\n")
-        f.write('MOVIES_PATHS=["/path/to/movies/"]\n')
-        f.write(f'TVSHOWS_PATHS=["{tmp_path}/"]\n')
-        f.write('TMDB_LANGUAGES=["en-US"]\n')
-        f.write("SCAN_SAMPLE_SIZE=3\n")
-        f.write("USE_SMB_MOUNT=false\n")  # Disable SMB mount
-        f.write("TVSHOWS_SEASON_SUBDIR_PATTERN=Season {season_number}\n")  # Match test data
-        env_file = f.name
-
-    try:
-        scraper = YoutubeTrailerScraper(env_file=env_file)
-        results = scraper.scan_for_tvshows_without_trailers(use_sample=True)
-        # Sample mode IS supported with CacheIt via sample_size parameter
-        assert len(results) == 3
-    finally:
-        os.unlink(env_file)
-
-
-def test_clear_cache():
+"""Tests for YoutubeTrailerScraper main functionality (scanning, caching, downloading).
+
+TMDB search is covered by test_tmdb_integration.py.
+
+The scraper fixture (see conftest.py) is shared across tests; tests that need
+other settings or mocked collaborators override its attributes through
+monkeypatch.
+"""
+
+from unittest.mock import MagicMock
+
+import pytest
+from conftest import write_env  # pylint: disable=import-error
+
+from youtubetrailerscraper import YoutubeTrailerScraper
+
+
+def test_injected_collaborators_are_used(tmp_path):
+    """Test a given search engine and downloader replace the ones built from settings."""
+    search_engine = MagicMock()
+    downloader = MagicMock()
+
+    scraper = YoutubeTrailerScraper(
+        env_file=write_env(tmp_path),
+        tmdb_search_engine=search_engine,
+        youtube_downloader=downloader,
+    )
+
+    assert scraper.tmdb_search_engine is search_engine
+    assert scraper.youtube_downloader is downloader
+
+
+@pytest.fixture
+def no_trailer_tvshows(clone_tvshow_scenario):
+    """Three TV shows, none of them with a trailer, in a directory of their own."""
+    return clone_tvshow_scenario("no_trailers")
+
+
+@pytest.mark.parametrize(
+    "paths_attr, scan",
+    [
+        pytest.param("movies_paths", "scan_for_movies_without_trailers", id="movies"),
+        pytest.param("tvshows_paths", "scan_for_tvshows_without_trailers", id="tvshows"),
+    ],
+)
+def test_scan_without_trailers_empty_paths(scraper, monkeypatch, paths_attr, scan):
+    """Test scan_for_*_without_trailers with no configured paths."""
+    monkeypatch.setattr(scraper, paths_attr, [])
+
+    results = getattr(scraper, scan)()
+    assert not results
+
+
+@pytest.mark.parametrize(
+    "paths_attr, scan, library, sample_size",
+    [
+        # Session-built library of 101 movies without trailers, only read here
+        pytest.param(
+            "movies_paths",
+            "scan_for_movies_without_trailers",
+            "movies_library_101",
+            3,
+            id="movies",
+        ),
+        pytest.param(
+            "tvshows_paths",
+            "scan_for_tvshows_without_trailers",
+            "no_trailer_tvshows",
+            2,
+            id="tvshows",
+        ),
+    ],
+)
+def test_scan_with_sample_mode(  # pylint: disable=too-many-arguments,too-many-positional-arguments
+    scraper, monkeypatch, request, paths_attr, scan, library, sample_size
+):
+    """Test scan_for_*_without_trailers with sample mode enabled."""
+    monkeypatch.setattr(scraper, paths_attr, [request.getfixturevalue(library)])
+    monkeypatch.setattr(scraper, "scan_sample_size", sample_size)
+
+    results = getattr(scraper, scan)(use_sample=True)
+    # Sample mode IS supported with CacheIt via sample_size parameter
+    assert len(results) == sample_size
+
+
+@pytest.mark.xdist_group("cache")  # see TestCachePersistence
+def test_clear_cache(scraper):
     """Test the clear_cache method."""
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".env", delete=False) as f:
-        f.write("TMDB_API_KEY=test_api_key\n")
-        f.write("TMDB_READ_ACCESS_TOKEN=test_token\n")
-        f.write('MOVIES_PATHS=["/path/to/movies/"]\n')
-        f.write('TVSHOWS_PATHS=["/path/to/tvshows/"]\n')
-        f.write('TMDB_LANGUAGES=["en-US"]\n')
-        env_file = f.name
-
-    try:
-        scraper = YoutubeTrailerScraper(env_file=env_file)
-        # Just verify the method can be called without errors
-        scraper.clear_cache()
-    finally:
-        os.unlink(env_file)
-
-
-def test_search_for_movie_trailer(mocker):
-    """Test the search_for_movie_trailer method with mocked TMDB search engine."""
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".env", delete=False) as f:
-        f.write("TMDB_API_KEY=test_api_key\n")
-        f.write("TMDB_READ_ACCESS_TOKEN=test_token\n")
-        f.write('MOVIES_PATHS=["/path/to/movies/"]\n')
-        f.write('TVSHOWS_PATHS=["/path/to/tvshows/"]\n')
-        f.write('TMDB_LANGUAGES=["en-US"]\n')
-        env_file = f.name
-
-    try:
-        scraper = YoutubeTrailerScraper(env_file=env_file)
-
-        # Mock the TMDBSearchEngine.search_movie method
-        mock_search = mocker.patch.object(
-            scraper.tmdb_search_engine,
-            "search_movie",
-            return_value=["https://www.youtube.com/watch?v=test123"],
-        )
-
-        # Test the method calls TMDBSearchEngine and returns results
-        result = scraper.search_for_movie_trailer("Test Movie", 2020)
-
-        # Verify TMDBSearchEngine.search_movie was called
-        mock_search.assert_called_once_with("Test Movie", 2020)
-
-        # Verify results
-        assert result == ["https://www.youtube.com/watch?v=test123"]
-    finally:
-        os.unlink(env_file)
-
-
-def test_download_trailers_for_movies(mocker, tmp_path):
+    # Just verify the method can be called without errors
+    scraper.clear_cache()
+
+
+def test_download_trailers_for_movies(scraper, monkeypatch, tmp_path):
     """Test the download_trailers_for_movies method."""
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".env", delete=False) as f:
-        f.write("TMDB_API_KEY=test_api_key\n")
-        f.write("TMDB_READ_ACCESS_TOKEN=test_token\n")
-        f.write('MOVIES_PATHS=["/path/to/movies/"]\n')
-        f.write('TVSHOWS_PATHS=["/path/to/tvshows/"]\n')
-        f.write('TMDB_LANGUAGES=["en-US"]\n')
-        env_file = f.name
-
-    try:
-        scraper = YoutubeTrailerScraper(env_file=env_file)
-
-        # Mock the YoutubeDownloader.download_trailers_for_movie method
-        movie1 = tmp_path / "Movie1 (2020)"
-        movie2 = tmp_path / "Movie2 (2021)"
-
-        mock_download = mocker.patch.object(
-            scraper.youtube_downloader,
-            "download_trailers_for_movie",
-            side_effect=[
-                [movie1 / "Movie1 (2020) - trailer #1 -trailer.mp4"],
-                [movie2 / "Movie2 (2021) - trailer #1 -trailer.mp4"],
-            ],
-        )
-
-        # Test data
-        trailer_results = {
-            movie1: ["https://youtube.com/watch?v=abc123"],
-            movie2: ["https://youtube.com/watch?v=def456"],
-        }
-
-        # Call the method
-        result = scraper.download_trailers_for_movies(trailer_results)
-
-        # Verify download method was called for each movie
-        assert mock_download.call_count == 2
-
-        # Verify results
-        assert len(result) == 2
-        assert len(result[movie1]) == 1
-        assert len(result[movie2]) == 1
-    finally:
-        os.unlink(env_file)
-
-
-def test_download_trailers_for_movies_empty_urls(tmp_path):
-    """Test download_trailers_for_movies with empty URL lists."""
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".env", delete=False) as f:
-        f.write("TMDB_API_KEY=test_api_key\n")
-        f.write("TMDB_READ_ACCESS_TOKEN=test_token\n")
-        f.write('MOVIES_PATHS=["/path/to/movies/"]\n')
-        f.write('TVSHOWS_PATHS=["/path/to/tvshows/"]\n')
-        f.write('TMDB_LANGUAGES=["en-US"]\n')
-        env_file = f.name
+    movies = [tmp_path / "Movie1 (2020)", tmp_path / "Movie2 (2021)"]
+    urls = [["https://youtube.com/watch?v=abc123"], ["https://youtube.com/watch?v=def456"]]
+
+    # Mock the YoutubeDownloader.download_trailers_for_movie method; one trailer
+    # per movie, produced lazily as the scraper asks for them
+    mock_download = MagicMock(
+        side_effect=([movie / f"{movie.name} - trailer #1 -trailer.mp4"] for movie in movies)
+    )
+    monkeypatch.setattr(scraper.youtube_downloader, "download_trailers_for_movie", mock_download)
 
-    try:
-        scraper = YoutubeTrailerScraper(env_file=env_file)
+    # Call the method
+    result = scraper.download_trailers_for_movies(dict(zip(movies, urls)))
 
-        movie1 = tmp_path / "Movie1 (2020)"
-        trailer_results = {movie1: []}
+    # Verify download method was called for each movie
+    assert mock_download.call_count == 2
+
+    # Verify results
+    assert len(result) == 2
+    assert all(len(result[movie]) == 1 for movie in movies)
+
+
+def test_download_trailers_for_movies_empty_urls(scraper, tmp_path):
+    """Test download_trailers_for_movies with empty URL lists."""
+    movie1 = tmp_path / "Movie1 (2020)"
+    trailer_results = {movie1: []}
 
-        result = scraper.download_trailers_for_movies(trailer_results)
+    result = scraper.download_trailers_for_movies(trailer_results)
 
-        # Should return empty list for movies with no URLs
-        assert result[movie1] == []
-    finally:
-        os.unlink(env_file)
+    # Should return empty list for movies with no URLs
+    assert result[movie1] == []
 
 
-def test_download_trailers_for_tvshows(mocker, tmp_path):
+def test_download_trailers_for_tvshows(scraper, monkeypatch, tmp_path):
     """Test the download_trailers_for_tvshows method."""
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".env", delete=False) as f:
-        f.write("TMDB_API_KEY=test_api_key\n")
-        f.write("TMDB_READ_ACCESS_TOKEN=test_token\n")
-        f.write('MOVIES_PATHS=["/path/to/movies/"]\n')
-        f.write('TVSHOWS_PATHS=["/path/to/tvshows/"]\n')
-        f.write('TMDB_LANGUAGES=["en-US"]\n')
-        env_file = f.name
-
-    try:
-        scraper = YoutubeTrailerScraper(env_file=env_file)
-
-        # Mock the YoutubeDownloader.download_trailers_for_tvshow method
-        tvshow1 = tmp_path / "Show1"
-        tvshow2 = tmp_path / "Show2"
-
-        mock_download = mocker.patch.object(
-            scraper.youtube_downloader,
-            "download_trailers_for_tvshow",
-            side_effect=[
-                [tvshow1 / "trailers" / "trailer #1.mp4"],
-                [tvshow2 / "trailers" / "trailer #1.mp4"],
-            ],
-        )
-
-        # Test data
-        trailer_results = {
-            tvshow1: ["https://youtube.com/watch?v=abc123"],
-            tvshow2: ["https://youtube.com/watch?v=def456"],
-        }
-
-        # Call the method
-        result = scraper.download_trailers_for_tvshows(trailer_results)
-
-        # Verify download method was called for each TV show
-        assert mock_download.call_count == 2
-
-        # Verify results
-        assert len(result) == 2
-        assert len(result[tvshow1]) == 1
-        assert len(result[tvshow2]) == 1
-    finally:
-        os.unlink(env_file)
-
-
-def test_download_trailers_for_tvshows_empty_urls(tmp_path):
+    tvshows = [tmp_path / "Show1", tmp_path / "Show2"]
+    urls = [["https://youtube.com/watch?v=abc123"], ["https://youtube.com/watch?v=def456"]]
+
+    # Mock the YoutubeDownloader.download_trailers_for_tvshow method; one trailer
+    # per TV show, produced lazily as the scraper asks for them
+    mock_download = MagicMock(
+        side_effect=([tvshow / "trailers" / "trailer #1.mp4"] for tvshow in tvshows)
+    )
+    monkeypatch.setattr(scraper.youtube_downloader, "download_trailers_for_tvshow", mock_download)
+
+    # Call the method
+    result = scraper.download_trailers_for_tvshows(dict(zip(tvshows, urls)))
+
+    # Verify download method was called for each TV show
+    assert mock_download.call_count == 2
+
+    # Verify results
+    assert len(result) == 2
+    assert all(len(result[tvshow]) == 1 for tvshow in tvshows)
+
+
+def test_download_trailers_for_tvshows_empty_urls(scraper, tmp_path):
     """Test download_trailers_for_tvshows with empty URL lists."""
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".env", delete=False) as f:
-        f.write("TMDB_API_KEY=test_api_key\n")
-        f.write("TMDB_READ_ACCESS_TOKEN=test_token\n")
-        f.write('MOVIES_PATHS=["/path/to/movies/"]\n')
-        f.write('TVSHOWS_PATHS=["/path/to/tvshows/"]\n')
-        f.write('TMDB_LANGUAGES=["en-US"]\n')
-        env_file = f.name
-
-    try:
-        scraper = YoutubeTrailerScraper(env_file=env_file)
-
-        tvshow1 = tmp_path / "Show1"
-        trailer_results = {tvshow1: []}
-
-        result = scraper.download_trailers_for_tvshows(trailer_results)
-
-        # Should return empty list for TV shows with no URLs
-        assert result[tvshow1] == []
-    finally:
-        os.unlink(env_file)
+    tvshow1 = tmp_path / "Show1"
+    trailer_results = {tvshow1: []}
+
+    result = scraper.download_trailers_for_tvshows(trailer_results)
+
+    # Should return empty list for TV shows with no URLs
+    assert result[tvshow1] == []